@@ -1,8 +1,10 @@
 """Shared utilities for Archi scripts."""
 
+import functools
 import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import time
@@ -13,17 +15,25 @@ ROOT = Path(__file__).resolve().parent.parent
 # Cross-platform venv python
 if sys.platform == "win32":
     VENV_PYTHON = ROOT / "venv" / "Scripts" / "python.exe"
-    VENV_PIP = ROOT / "venv" / "Scripts" / "pip.exe"
 else:
     VENV_PYTHON = ROOT / "venv" / "bin" / "python"
-    VENV_PIP = ROOT / "venv" / "bin" / "pip"
 
 PYTHON = str(VENV_PYTHON) if VENV_PYTHON.exists() else sys.executable
-PIP = str(VENV_PIP) if VENV_PIP.exists() else f"{sys.executable} -m pip"
+# pip as an argv prefix for run(): always the interpreter's own pip module,
+# so the install lands in the same environment as PYTHON
+PIP_ARGV: list[str] = [PYTHON, "-m", "pip"]
 
 ENV_PATH = ROOT / ".env"
 
 
+def enter_project() -> None:
+    """Make ``src.*`` importable in-process and run from the project root."""
+    root = str(ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    os.chdir(root)
+
+
 def header(title: str) -> None:
     """Print a section header."""
     print(f"\n{'=' * 60}")
@@ -31,21 +41,34 @@ def header(title: str) -> None:
     print(f"{'=' * 60}\n")
 
 
-def run(cmd: str, check: bool = True) -> int:
-    """Run a shell command and return exit code."""
-    print(f"  > {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=str(ROOT))
+def run(cmd: list[str], check: bool = True) -> int:
+    """Run a command (argv list, no shell) and return exit code."""
+    print(f"  > {subprocess.list2cmdline(cmd)}")
+    result = subprocess.run(cmd, cwd=str(ROOT))
     if check and result.returncode != 0:
         print(f"  [WARNING] Command exited with code {result.returncode}")
     return result.returncode
 
 
 def load_env() -> None:
-    """Load .env into os.environ."""
+    """Load .env into os.environ.
+
+    The file is only parsed again when its modification time changes, so
+    repeated calls from different entry points cost a single stat.
+    """
+    try:
+        mtime_ns = ENV_PATH.stat().st_mtime_ns
+    except OSError:
+        return
+    _load_env_file(mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_file(mtime_ns: int) -> None:
+    """Parse .env for a given mtime (the argument is only the cache key)."""
     try:
         from dotenv import load_dotenv
-        if ENV_PATH.exists():
-            load_dotenv(ENV_PATH, override=True)
+        load_dotenv(ENV_PATH, override=True)
     except ImportError:
         pass
 
@@ -53,7 +76,8 @@ def load_env() -> None:
 BACKUP_ROOT = ROOT / "backup"
 
 
-def backup_file(filepath: Path, quiet: bool = False) -> Path | None:
+def backup_file(filepath: Path, quiet: bool = False,
+                move: bool = False) -> Path | None:
     """Create a timestamped backup of *filepath* before overwriting it.
 
     Backups are stored in a centralized ``backup/`` folder at the project
@@ -63,9 +87,18 @@ def backup_file(filepath: Path, quiet: bool = False) -> Path | None:
         config/archi_identity.yaml
           -> backup/config/archi_identity.20260225_153000.yaml
 
-    Returns the backup path, or None if the source file didn't exist.
+    Pass ``move=True`` when the caller is about to delete or overwrite the
+    file anyway: it is renamed into ``backup/`` (one metadata update) rather
+    than copied byte-for-byte, falling back to a copy if the rename fails.
+
+    Returns the backup path, or None if the source file didn't exist or was
+    empty (nothing worth preserving).
     """
-    if not filepath.is_file():
+    try:
+        st = filepath.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
         return None
 
     filepath = filepath.resolve()
@@ -83,7 +116,14 @@ def backup_file(filepath: Path, quiet: bool = False) -> Path | None:
 
     try:
         bak.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(filepath), str(bak))
+        if move:
+            try:
+                os.replace(filepath, bak)
+            except OSError:
+                # Different volume or file held open — copy instead
+                shutil.copy2(str(filepath), str(bak))
+        else:
+            shutil.copy2(str(filepath), str(bak))
         if not quiet:
             print(f"  Backed up {rel} -> backup/{rel.parent / bak_name}")
         return bak
@@ -93,18 +133,83 @@ def backup_file(filepath: Path, quiet: bool = False) -> Path | None:
         return None
 
 
+# Key of a .env assignment line: optional "export", then NAME, then "="
+_ENV_KEY_RE = re.compile(r"\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+
 def set_env(name: str, value: str) -> None:
-    """Set a key=value in .env (create or update)."""
-    env_content = ""
+    """Set a key=value in .env (create or update).
+
+    Only a line that assigns NAME is replaced (``export NAME=`` and spaces
+    around ``=`` count, as they do for python-dotenv), so keys that merely
+    contain NAME are left alone.  The new content goes to a temp file that
+    is swapped in with os.replace, so an interrupted write can't leave a
+    truncated .env behind.
+    """
+    set_env_batch({name: value})
+
+
+def set_env_batch(updates: dict[str, str]) -> None:
+    """Apply several :func:`set_env` updates with one read and one write.
+
+    Keys already in .env are replaced in place; new keys are appended in
+    the order given.
+    """
+    if not updates:
+        return
+    old_content = ""
     if ENV_PATH.is_file():
-        env_content = ENV_PATH.read_text(encoding="utf-8")
-    old_content = env_content
-    if f"{name}=" in env_content:
-        env_content = re.sub(rf"{re.escape(name)}=.*", f"{name}={value}", env_content)
-    else:
-        env_content = env_content.rstrip() + f"\n{name}={value}\n"
-    # Only back up if the file actually changed
-    if env_content != old_content and old_content.strip():
-        backup_file(ENV_PATH, quiet=True)
-    ENV_PATH.write_text(env_content, encoding="utf-8")
-    print(f"  Set {name}={value} in .env")
+        old_content = ENV_PATH.read_text(encoding="utf-8")
+
+    lines = []
+    found = set()
+    for line in old_content.splitlines():
+        m = _ENV_KEY_RE.match(line)
+        if m and m.group(1) in updates:
+            name = m.group(1)
+            line = f"{name}={updates[name]}"
+            found.add(name)
+        lines.append(line)
+    missing = [name for name in updates if name not in found]
+    if missing:
+        while lines and not lines[-1].strip():
+            lines.pop()
+        lines.extend(f"{name}={updates[name]}" for name in missing)
+    env_content = "\n".join(lines) + "\n"
+
+    if env_content != old_content:
+        # Only back up if the file actually changed
+        if old_content.strip():
+            backup_file(ENV_PATH, quiet=True)
+        tmp_path = ENV_PATH.with_name(ENV_PATH.name + ".tmp")
+        tmp_path.write_text(env_content, encoding="utf-8")
+        os.replace(tmp_path, ENV_PATH)
+    for name, value in updates.items():
+        print(f"  Set {name}={value} in .env")
+
+
+# Directory names the cache sweep never descends into
+CACHE_SWEEP_SKIP_DIRS = frozenset({
+    "venv", ".venv", "node_modules", ".git", "_archive", ".pytest_cache",
+})
+# Asset trees at the project root; pruned only there (src/models/ is code)
+CACHE_SWEEP_SKIP_TOP_DIRS = frozenset({"models", "data", "logs", "workspace", "backup"})
+
+
+def find_cache_dirs(names: frozenset = frozenset({"__pycache__"})):
+    """Yield the path of every directory under ROOT named one of *names*."""
+    stack = [(str(ROOT), CACHE_SWEEP_SKIP_DIRS | CACHE_SWEEP_SKIP_TOP_DIRS)]
+    while stack:
+        path, skip = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name in names:
+                    yield entry.path
+                elif entry.name not in skip:
+                    stack.append((entry.path, CACHE_SWEEP_SKIP_DIRS))
@@ -10,69 +10,101 @@ Usage:
     python scripts/fix.py state         (repair state / create goals)
 """
 
+import json
 import os
-import shutil
-import subprocess
 import sys
+from functools import partial
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from _common import ROOT, PYTHON, VENV_PYTHON, header, run, load_env, set_env, backup_file
-
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-os.chdir(str(ROOT))
+from _common import (ROOT, PYTHON, VENV_PYTHON, enter_project, find_cache_dirs,
+                     header, run, load_env, set_env_batch, backup_file)
 
 
 # ── 1. Diagnostics ────────────────────────────────────────────
 
+# (key, severity when unset, what breaks, fix hint)
+REQUIRED_ENV_KEYS = [
+    ("OPENROUTER_API_KEY", "ERROR", "Archi cannot make API calls",
+     "Add OPENROUTER_API_KEY=your_key to .env"),
+    ("DISCORD_BOT_TOKEN", "WARN", "Discord interface disabled",
+     "Add DISCORD_BOT_TOKEN=your_token to .env"),
+]
+
+
+def _detect_image_model(model_names: set[str]) -> str | None:
+    """Return the single image model in models/, if there is exactly one."""
+    candidates = [n for n in model_names if "mmproj" not in n.lower()]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+# Optional key -> auto-detector for an unset value (None: report only)
+OPTIONAL_ENV_KEYS = {
+    "IMAGE_MODEL_PATH": _detect_image_model,
+    "ARCHI_VOICE_ENABLED": None,
+}
+
+
 def run_diagnostics() -> None:
     header("Archi Diagnostics")
+    # Only diagnostics imports src/ into this process (src/ falls back to
+    # the CWD when it can't locate the project root); clean, test and
+    # state work on absolute paths or child processes and don't need it.
+    enter_project()
     issues = []       # (severity, message, fix_hint)
     auto_fixes = []   # (description, callable)
+    env_fixes = {}    # .env key -> value; written in one batch
+
+    load_env()
+    env = dict(os.environ)
+    openrouter_key = env.get("OPENROUTER_API_KEY", "")
+
+    # The import probe runs in a child interpreter, so start it now and
+    # collect its report when that section is printed.  The sections that
+    # import src/ into this process run one after another.
+    import_probe = _start_import_probe([m for m, _ in IMPORT_CHECKS])
 
     # ── Python & venv ──
-    print("── Python Environment ──")
-    print(f"  Python: {sys.executable}")
-    print(f"  Version: {sys.version}")
+    out = ["── Python Environment ──"]
+    out.append(f"  Python: {sys.executable}")
+    out.append(f"  Version: {sys.version}")
     venv_ok = VENV_PYTHON.exists()
-    print(f"  Venv: {'Yes' if venv_ok else 'No'}")
+    out.append(f"  Venv: {'Yes' if venv_ok else 'No'}")
     if not venv_ok:
         issues.append(("ERROR", "No virtual environment found",
                         "Run: python -m venv venv"))
-    print()
+    out.append("")
+    _write_lines(out)
 
     # ── .env check ──
-    load_env()
-    print("── Environment Variables ──")
+    out = ["── Environment Variables ──"]
     env_file = ROOT / ".env"
     if not env_file.is_file():
         issues.append(("ERROR", ".env file missing",
                         "Copy .env.example to .env and fill in your values"))
 
-    # Check the key that actually matters
-    openrouter_key = os.environ.get("OPENROUTER_API_KEY", "")
-    discord_token = os.environ.get("DISCORD_BOT_TOKEN", "")
-    print(f"  OPENROUTER_API_KEY: {'set (' + str(len(openrouter_key)) + ' chars)' if openrouter_key else 'NOT SET'}")
-    if not openrouter_key:
-        issues.append(("ERROR", "OPENROUTER_API_KEY not set — Archi cannot make API calls",
-                       "Add OPENROUTER_API_KEY=your_key to .env"))
-    print(f"  DISCORD_BOT_TOKEN: {'set (' + str(len(discord_token)) + ' chars)' if discord_token else 'NOT SET'}")
-    if not discord_token:
-        issues.append(("WARN", "DISCORD_BOT_TOKEN not set — Discord interface disabled",
-                       "Add DISCORD_BOT_TOKEN=your_token to .env"))
+    # Check the keys that actually matter
+    for key, severity, impact, hint in REQUIRED_ENV_KEYS:
+        val = env.get(key, "")
+        out.append(f"  {key}: {f'set ({len(val)} chars)' if val else 'NOT SET'}")
+        if not val:
+            issues.append((severity, f"{key} not set — {impact}", hint))
 
     # Optional env vars
     models_dir = ROOT / "models"
-    optional_keys = [
-        "IMAGE_MODEL_PATH", "ARCHI_VOICE_ENABLED",
-    ]
-    for key in optional_keys:
-        val = os.environ.get(key, "")
+    model_files = _scan_safetensors(models_dir)
+    model_names = {name for name, _ in model_files or ()}
+    for key, detect in OPTIONAL_ENV_KEYS.items():
+        val = env.get(key, "")
         if val:
             if val.endswith((".onnx", ".safetensors")):
-                fname = Path(val).name
-                exists = Path(val).exists()
+                path = ROOT / val  # relative values are relative to ROOT
+                fname = path.name
+                # The models/ scan only lists .safetensors
+                if path.parent == models_dir and fname.endswith(".safetensors"):
+                    exists = fname in model_names
+                else:
+                    exists = path.exists()
                 display = f"{fname} ({'found' if exists else 'FILE MISSING'})"
                 if not exists:
                     issues.append(("WARN", f"{key} points to missing file: {fname}",
@@ -81,123 +113,229 @@ def run_diagnostics() -> None:
                 display = val
         else:
             display = "not set (optional)"
-            # Auto-detect image model
-            if key == "IMAGE_MODEL_PATH" and models_dir.is_dir():
-                safetensors = [f for f in models_dir.glob("*.safetensors")
-                               if "mmproj" not in f.name.lower()]
-                if len(safetensors) == 1:
-                    display = f"not set (found {safetensors[0].name} — can auto-fix)"
-                    fix_val = safetensors[0].resolve().as_posix()
-                    auto_fixes.append((
-                        f"Set IMAGE_MODEL_PATH in .env",
-                        lambda v=fix_val: set_env("IMAGE_MODEL_PATH", v),
-                    ))
-        print(f"  {key}: {display}")
-    print()
+            found = detect(model_names) if detect and model_files is not None else None
+            if found:
+                display = f"not set (found {found} — can auto-fix)"
+                fix_val = f"{models_dir.as_posix()}/{found}"
+                env_fixes[key] = fix_val
+        out.append(f"  {key}: {display}")
+    out.append("")
+    _write_lines(out)
 
     # ── Model files ──
-    print("── Model Files ──")
-    if models_dir.is_dir():
-        safetensors_files = list(models_dir.glob("*.safetensors"))
-        for f in safetensors_files:
-            size_gb = f.stat().st_size / (1024**3)
-            print(f"  {f.name}: {size_gb:.2f} GB (image gen)")
-        if not safetensors_files:
-            print("  No .safetensors files (image gen not available)")
+    out = ["── Model Files ──"]
+    if model_files is not None:
+        for name, size in model_files:
+            out.append(f"  {name}: {size / (1024**3):.2f} GB (image gen)")
+        if not model_files:
+            out.append("  No .safetensors files (image gen not available)")
     else:
-        print("  models/ directory not found")
+        out.append("  models/ directory not found")
+    out.append("")
+    _write_lines(out)
+
+    # ── Slow sections (imports, network, database) ──
+    slow_sections = [
+        _diag_image_gen,
+        partial(_diag_module_imports, import_probe),
+        partial(_diag_api, openrouter_key),
+        partial(_diag_router, openrouter_key),
+        _diag_cost_tracker,
+    ]
+    for section in slow_sections:
+        section_lines, section_issues = section()
+        _write_lines(section_lines)
+        issues.extend(section_issues)
+
+    # ── Data directories ──
+    out = ["── Data Directories ──"]
+    required_dirs = ["data", "logs", "config", "workspace"]
+    missing_dirs = []
+    with os.scandir(ROOT) as it:
+        root_dirs = {entry.name for entry in it if entry.is_dir()}
+    for d in required_dirs:
+        if d in root_dirs:
+            out.append(f"  {d}/: OK")
+        else:
+            out.append(f"  {d}/: MISSING")
+            missing_dirs.append(d)
+    if missing_dirs:
+        auto_fixes.append((
+            f"Create missing directories: {', '.join(missing_dirs)}",
+            partial(_auto_create_dirs, missing_dirs),
+        ))
+    _write_lines(out)
+
+    # ── Summary ──
+    errors = [i for i in issues if i[0] == "ERROR"]
+    warnings = [i for i in issues if i[0] == "WARN"]
+
+    fix_descs = [f"Set {key} in .env" for key in env_fixes]
+    fix_descs += [desc for desc, _ in auto_fixes]
+
+    if not issues and not fix_descs:
+        _write_lines([
+            f"\n{'=' * 60}",
+            "  All checks passed — Archi looks healthy!",
+            f"{'=' * 60}",
+        ])
+        return
+
+    out = [f"\n{'=' * 60}"]
+    out.append(f"  Issues Found: {len(errors)} error(s), {len(warnings)} warning(s)")
+    out.append(f"{'=' * 60}")
+
+    if errors:
+        out.append("\n  ERRORS:")
+        for _, msg, fix in errors:
+            out.append(f"    [!!] {msg}")
+            out.append(f"         Fix: {fix}")
+
+    if warnings:
+        out.append("\n  WARNINGS:")
+        for _, msg, fix in warnings:
+            out.append(f"    [!]  {msg}")
+            out.append(f"         Fix: {fix}")
+
+    if fix_descs:
+        out.append(f"\n  AUTO-FIXABLE ({len(fix_descs)} item(s)):")
+        for desc in fix_descs:
+            out.append(f"    [*] {desc}")
+    _write_lines(out)
+
+    if fix_descs:
+        answer = input("\n  Apply auto-fixes? (Y/n): ").strip().lower()
+        if answer in ("", "y", "yes"):
+            if env_fixes:
+                try:
+                    set_env_batch(env_fixes)
+                    load_env()
+                    for key in env_fixes:
+                        print(f"    Fixed: Set {key} in .env")
+                except Exception as e:
+                    for key in env_fixes:
+                        print(f"    Failed: Set {key} in .env — {e}")
+            for desc, fix_fn in auto_fixes:
+                try:
+                    fix_fn()
+                    print(f"    Fixed: {desc}")
+                except Exception as e:
+                    print(f"    Failed: {desc} — {e}")
+            print("\n  Auto-fixes applied. Run diagnostics again to verify.")
+        else:
+            print("  Skipped auto-fixes.")
     print()
 
-    # ── Image generation ──
-    print("── Image Generation ──")
-    try:
-        import torch as _torch
-        cuda_tag = "CUDA" if _torch.cuda.is_available() else "CPU-only"
-        print(f"  PyTorch: {_torch.__version__} ({cuda_tag})")
-        if not _torch.cuda.is_available():
+
+# Image-gen dependencies reported by version only
+IMAGE_GEN_PACKAGES = ("diffusers", "accelerate", "safetensors")
+
+
+def _diag_image_gen() -> tuple[list[str], list[tuple]]:
+    lines = ["── Image Generation ──"]
+    issues = []
+    torch_status = _torch_cuda_status()
+    if torch_status is None:
+        lines.append("  PyTorch: NOT INSTALLED")
+    else:
+        torch_version, cuda_ok = torch_status
+        cuda_tag = "CUDA" if cuda_ok else "CPU-only"
+        lines.append(f"  PyTorch: {torch_version} ({cuda_tag})")
+        if not cuda_ok:
             issues.append(("WARN",
                 "PyTorch has NO CUDA support — image gen will be CPU-only (very slow)",
                 "Run: scripts/install.py imagegen"))
-    except ImportError:
-        print("  PyTorch: NOT INSTALLED")
-
-    for pkg_name, import_name in [("diffusers", "diffusers"), ("accelerate", "accelerate"),
-                                   ("safetensors", "safetensors")]:
-        try:
-            mod = __import__(import_name)
-            print(f"  {pkg_name}: {mod.__version__}")
-        except ImportError:
-            print(f"  {pkg_name}: not installed")
-    print()
 
-    # ── Key imports ──
-    print("── Module Imports ──")
-    modules_to_check = [
-        ("src.core.agent_loop", "Agent Loop"),
-        ("src.models.router", "Model Router"),
-        ("src.monitoring.health_check", "Health Check"),
-        ("src.monitoring.cost_tracker", "Cost Tracker"),
-        ("src.interfaces.discord_bot", "Discord Bot"),
-        ("src.tools.image_gen", "Image Generator"),
-    ]
-    for module_name, label in modules_to_check:
+    import importlib.metadata
+    for pkg_name in IMAGE_GEN_PACKAGES:
         try:
-            __import__(module_name)
-            print(f"  {label}: OK")
-        except Exception as e:
-            err = str(e).split("\n")[0][:60]
-            print(f"  {label}: FAILED ({err})")
+            lines.append(f"  {pkg_name}: {importlib.metadata.version(pkg_name)}")
+        except importlib.metadata.PackageNotFoundError:
+            lines.append(f"  {pkg_name}: not installed")
+    lines.append("")
+    return lines, issues
+
+
+# (module, label) pairs checked by the Module Imports section
+IMPORT_CHECKS = [
+    ("src.core.agent_loop", "Agent Loop"),
+    ("src.models.router", "Model Router"),
+    ("src.monitoring.health_check", "Health Check"),
+    ("src.monitoring.cost_tracker", "Cost Tracker"),
+    ("src.interfaces.discord_bot", "Discord Bot"),
+    ("src.tools.image_gen", "Image Generator"),
+]
+
+
+def _diag_module_imports(probe) -> tuple[list[str], list[tuple]]:
+    lines = ["── Module Imports ──"]
+    issues = []
+    import_errors = _probe_imports(probe, [m for m, _ in IMPORT_CHECKS])
+    for module_name, label in IMPORT_CHECKS:
+        err = import_errors.get(module_name)
+        if err is None:
+            lines.append(f"  {label}: OK")
+        else:
+            lines.append(f"  {label}: FAILED ({err})")
             issues.append(("WARN", f"{label} import failed: {err}",
                            f"Check {module_name.replace('.', '/')}.py"))
-    print()
+    lines.append("")
+    return lines, issues
 
-    # ── API connectivity ──
-    print("── API Connectivity ──")
-    load_env()
-    if os.environ.get("OPENROUTER_API_KEY"):
+
+def _diag_api(openrouter_key: str) -> tuple[list[str], list[tuple]]:
+    lines = ["── API Connectivity ──"]
+    issues = []
+    if openrouter_key:
         try:
             from src.models.openrouter_client import OpenRouterClient
             client = OpenRouterClient()
             r = client.generate("Say OK", max_tokens=5)
             if r.get("success"):
                 model = r.get("model", "unknown")
-                print(f"  OpenRouter API: OK (model={model})")
+                lines.append(f"  OpenRouter API: OK (model={model})")
             else:
                 err = r.get("error", "unknown error")
-                print(f"  OpenRouter API: FAILED ({err})")
+                lines.append(f"  OpenRouter API: FAILED ({err})")
                 issues.append(("ERROR", f"OpenRouter API call failed: {err}",
                                "Check OPENROUTER_API_KEY and network connectivity"))
         except Exception as e:
             err = str(e).split("\n")[0][:80]
-            print(f"  OpenRouter API: ERROR ({err})")
+            lines.append(f"  OpenRouter API: ERROR ({err})")
             issues.append(("ERROR", f"OpenRouter API error: {err}",
                            "Check OPENROUTER_API_KEY and network connectivity"))
     else:
-        print("  OpenRouter API: SKIPPED (no API key)")
-    print()
+        lines.append("  OpenRouter API: SKIPPED (no API key)")
+    lines.append("")
+    return lines, issues
+
 
-    # ── Router smoke test ──
-    print("── Router Smoke Test ──")
-    if os.environ.get("OPENROUTER_API_KEY"):
+def _diag_router(openrouter_key: str) -> tuple[list[str], list[tuple]]:
+    lines = ["── Router Smoke Test ──"]
+    issues = []
+    if openrouter_key:
         try:
             from src.models.router import ModelRouter
             router = ModelRouter()
             stats = router.get_stats()
-            print(f"  Router init: OK")
-            print(f"  Cache entries: {stats.get('cached_entries', 0)}")
+            lines.append(f"  Router init: OK")
+            lines.append(f"  Cache entries: {stats.get('cached_entries', 0)}")
             info = router.get_active_model_info()
-            print(f"  Active model: {info.get('display', 'unknown')}")
+            lines.append(f"  Active model: {info.get('display', 'unknown')}")
         except Exception as e:
             err = str(e).split("\n")[0][:80]
-            print(f"  Router init: FAILED ({err})")
+            lines.append(f"  Router init: FAILED ({err})")
             issues.append(("WARN", f"Router init failed: {err}",
                            "Check src/models/router.py"))
     else:
-        print("  Router: SKIPPED (no API key)")
-    print()
+        lines.append("  Router: SKIPPED (no API key)")
+    lines.append("")
+    return lines, issues
+
 
-    # ── Cost tracker ──
-    print("── Cost Tracker ──")
+def _diag_cost_tracker() -> tuple[list[str], list[tuple]]:
+    lines = ["── Cost Tracker ──"]
+    issues = []
     try:
         from src.monitoring.cost_tracker import CostTracker
         ct = CostTracker()
@@ -206,76 +344,100 @@ def run_diagnostics() -> None:
         month_data = summary.get("month", {})
         today_cost = today_data.get("total_cost", 0.0) if isinstance(today_data, dict) else 0.0
         month_cost = month_data.get("total_cost", 0.0) if isinstance(month_data, dict) else 0.0
-        print(f"  Today: ${today_cost:.4f}")
-        print(f"  This month: ${month_cost:.4f}")
-        print(f"  All-time calls: {summary.get('total_calls', 0)}")
+        lines.append(f"  Today: ${today_cost:.4f}")
+        lines.append(f"  This month: ${month_cost:.4f}")
+        lines.append(f"  All-time calls: {summary.get('total_calls', 0)}")
     except Exception as e:
         err = str(e).split("\n")[0][:60]
-        print(f"  Cost tracker: FAILED ({err})")
+        lines.append(f"  Cost tracker: FAILED ({err})")
         issues.append(("WARN", f"Cost tracker failed: {err}",
                        "Check src/monitoring/cost_tracker.py"))
-    print()
+    lines.append("")
+    return lines, issues
 
-    # ── Data directories ──
-    print("── Data Directories ──")
-    required_dirs = ["data", "logs", "config", "workspace"]
-    missing_dirs = []
-    for d in required_dirs:
-        p = ROOT / d
-        if p.is_dir():
-            print(f"  {d}/: OK")
-        else:
-            print(f"  {d}/: MISSING")
-            missing_dirs.append(d)
-    if missing_dirs:
-        auto_fixes.append((
-            f"Create missing directories: {', '.join(missing_dirs)}",
-            lambda dirs=missing_dirs: _auto_create_dirs(dirs),
-        ))
 
-    # ── Summary ──
-    errors = [i for i in issues if i[0] == "ERROR"]
-    warnings = [i for i in issues if i[0] == "WARN"]
+# Runs in a child interpreter so the heavy src/ imports (torch, discord,
+# diffusers, ...) never load into the diagnostics process itself.
+_IMPORT_PROBE = """\
+import json, sys
+for name in sys.argv[1:]:
+    try:
+        __import__(name)
+        err = None
+    except Exception as e:
+        err = str(e).split("\\n")[0][:60]
+    print(json.dumps({"module": name, "error": err}), flush=True)
+"""
 
-    if not issues and not auto_fixes:
-        print(f"\n{'=' * 60}")
-        print("  All checks passed — Archi looks healthy!")
-        print(f"{'=' * 60}")
-        return
 
-    print(f"\n{'=' * 60}")
-    print(f"  Issues Found: {len(errors)} error(s), {len(warnings)} warning(s)")
-    print(f"{'=' * 60}")
+def _start_import_probe(modules: list[str]):
+    """Launch the import probe for *modules*; returns the Popen or the OSError."""
+    import subprocess
+    try:
+        return subprocess.Popen(
+            [PYTHON, "-c", _IMPORT_PROBE, *modules],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            cwd=str(ROOT),
+        )
+    except OSError as e:
+        return e
+
+
+def _probe_imports(probe, modules: list[str]) -> dict[str, str | None]:
+    """Wait for *probe*; map each of *modules* to None (ok) or an error.
+
+    The probe reports one JSON object per line; anything else on stdout
+    (banners printed by the modules themselves) is ignored.
+    """
+    if isinstance(probe, OSError):
+        return {m: f"could not start {PYTHON}: {probe}" for m in modules}
+    results: dict[str, str | None] = {
+        m: "no result (import probe crashed)" for m in modules
+    }
+    stdout, _ = probe.communicate()
+    for line in stdout.splitlines():
+        if not line.startswith("{"):
+            continue
+        try:
+            record = json.loads(line)
+            name = record["module"]
+        except (ValueError, KeyError, TypeError):
+            continue
+        if name in results:
+            results[name] = record.get("error")
+    return results
 
-    if errors:
-        print("\n  ERRORS:")
-        for _, msg, fix in errors:
-            print(f"    [!!] {msg}")
-            print(f"         Fix: {fix}")
 
-    if warnings:
-        print("\n  WARNINGS:")
-        for _, msg, fix in warnings:
-            print(f"    [!]  {msg}")
-            print(f"         Fix: {fix}")
+def _torch_cuda_status() -> tuple[str, bool] | None:
+    """Return (torch version, CUDA available), or None if torch is missing.
 
-    if auto_fixes:
-        print(f"\n  AUTO-FIXABLE ({len(auto_fixes)} item(s)):")
-        for desc, _ in auto_fixes:
-            print(f"    [*] {desc}")
+    Always probed live: this is what diagnose exists to check, and the
+    answer changes with the driver as well as the torch build.
+    """
+    try:
+        import torch as _torch
+    except ImportError:
+        return None
+    return _torch.__version__, _torch.cuda.is_available()
 
-        answer = input("\n  Apply auto-fixes? (Y/n): ").strip().lower()
-        if answer in ("", "y", "yes"):
-            for desc, fix_fn in auto_fixes:
-                try:
-                    fix_fn()
-                    print(f"    Fixed: {desc}")
-                except Exception as e:
-                    print(f"    Failed: {desc} — {e}")
-            print("\n  Auto-fixes applied. Run diagnostics again to verify.")
-        else:
-            print("  Skipped auto-fixes.")
-    print()
+
+def _scan_safetensors(models_dir: Path) -> list[tuple[str, int]] | None:
+    """Return (name, size) per .safetensors file, or None if no *models_dir*."""
+    try:
+        it = os.scandir(models_dir)
+    except OSError:
+        return None
+    with it:
+        return sorted(
+            (entry.name, entry.stat().st_size)
+            for entry in it
+            if entry.name.endswith(".safetensors") and entry.is_file()
+        )
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a report section to stdout."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _auto_create_dirs(dirs: list) -> None:
@@ -295,7 +457,7 @@ def run_tests() -> None:
     choice = input("Select [1]: ").strip() or "1"
 
     if choice == "1":
-        run(f'"{PYTHON}" -m pytest tests/ -v --tb=short', check=False)
+        run([PYTHON, "-m", "pytest", "tests/", "-v", "--tb=short"], check=False)
     elif choice == "2":
         print("\n  Running smoke test...\n")
         failures = 0
@@ -305,12 +467,13 @@ def run_tests() -> None:
             "src.models.router",
             "src.monitoring.health_check",
         ]
+        import_errors = _probe_imports(test_imports)
         for mod in test_imports:
-            try:
-                __import__(mod)
+            err = import_errors.get(mod)
+            if err is None:
                 print(f"  [PASS] import {mod}")
-            except Exception as e:
-                print(f"  [FAIL] import {mod}: {e}")
+            else:
+                print(f"  [FAIL] import {mod}: {err}")
                 failures += 1
 
         for d in ["data", "logs", "config"]:
@@ -330,6 +493,25 @@ def run_tests() -> None:
 
 # ── 3. Clean ──────────────────────────────────────────────────
 
+# Screenshot/debug artifacts in data/ (data/debug_*.png, data/temp_*.png)
+TEMP_FILE_PREFIXES = ("debug_", "temp_")
+
+def _scandir_files(root: str):
+    """Yield the path of every regular file below *root* (no symlink follow)."""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
 def run_clean() -> None:
     header("Clean — Cache & Artifact Removal")
 
@@ -355,43 +537,46 @@ def run_clean() -> None:
         print("  Unknown option.")
         return
 
+    import shutil
     cleaned = 0
 
     if "pycache" in items:
-        print("\n  Removing __pycache__ directories (skipping venv/)...")
-        skip_dirs = {"venv", ".venv", "node_modules", ".git"}
-        for dirpath, dirnames, _ in os.walk(str(ROOT)):
-            dirnames[:] = [d for d in dirnames if d not in skip_dirs]
-            for d in dirnames:
-                if d == "__pycache__":
-                    full = os.path.join(dirpath, d)
-                    shutil.rmtree(full, ignore_errors=True)
-                    rel = os.path.relpath(full, str(ROOT))
-                    print(f"    Removed: {rel}/")
-                    cleaned += 1
+        print("\n  Removing __pycache__ directories (skipping venv/ and asset dirs)...")
+        removed = 0
+        for full in find_cache_dirs():
+            shutil.rmtree(full, ignore_errors=True)
+            removed += 1
+        print(f"    Removed {removed} __pycache__ director{'y' if removed == 1 else 'ies'}")
+        cleaned += removed
 
     if "temp" in items:
         print("\n  Removing temp/debug files...")
-        for pattern in ["data/debug_*.png", "data/temp_*.png"]:
-            for f in ROOT.glob(pattern):
-                f.unlink()
-                print(f"    Deleted: {f.relative_to(ROOT)}")
-                cleaned += 1
+        data_dir = ROOT / "data"
+        if data_dir.is_dir():
+            with os.scandir(data_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if (name.startswith(TEMP_FILE_PREFIXES) and name.endswith(".png")
+                            and entry.is_file()):
+                        os.unlink(entry.path)
+                        print(f"    Deleted: {Path('data', name)}")
+                        cleaned += 1
 
     if "logs" in items:
         print("\n  Clearing logs...")
         logs_dir = ROOT / "logs"
         if logs_dir.is_dir():
-            # Back up key log files before deletion
+            # Back up key log files before deletion.  Copied, not moved: a
+            # running Archi would keep appending to a moved file's inode.
             for name in ("conversations.jsonl", "archi_crashes.log"):
-                lf = logs_dir / name
-                if lf.is_file() and lf.stat().st_size > 0:
-                    backup_file(lf)
-            for f in logs_dir.rglob("*"):
-                if f.is_file():
-                    f.unlink()
-                    print(f"    Deleted: {f.relative_to(ROOT)}")
-                    cleaned += 1
+                backup_file(logs_dir / name)
+            # The logger recreates logs/actions and logs/errors on start
+            before = sum(1 for _ in _scandir_files(str(logs_dir)))
+            shutil.rmtree(logs_dir, ignore_errors=True)
+            logs_dir.mkdir(parents=True, exist_ok=True)
+            removed = before - sum(1 for _ in _scandir_files(str(logs_dir)))
+            print(f"    Deleted {removed} log file(s)")
+            cleaned += removed
 
     print(f"\n  Cleaned {cleaned} items.")
 
@@ -416,7 +601,7 @@ def repair_state() -> None:
         print("\n  Resetting goals...")
         goals_file = ROOT / "data" / "goals_state.json"
         if goals_file.exists():
-            backup_file(goals_file)
+            backup_file(goals_file, move=True)
             goals_file.write_text('{"goals": []}\n', encoding="utf-8")
             print("    Reset goals_state.json")
         else:
@@ -442,8 +627,8 @@ def repair_state() -> None:
             for db_file in db_files:
                 confirm = input(f"    Delete {db_file.relative_to(ROOT)}? (y/N): ").strip().lower()
                 if confirm == "y":
-                    backup_file(db_file)
-                    db_file.unlink()
+                    backup_file(db_file, move=True)
+                    db_file.unlink(missing_ok=True)
                     print(f"    Deleted: {db_file.relative_to(ROOT)}")
                 else:
                     print(f"    Skipped: {db_file.relative_to(ROOT)}")
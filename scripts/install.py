@@ -16,15 +16,23 @@ Usage:
     python scripts/install.py --check          (verify setup without changes)
 """
 
+import functools
+import importlib
+import importlib.metadata
+import importlib.util
+import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from _common import ROOT, PYTHON, PIP, ENV_PATH, header, run, set_env, load_env
+from _common import ROOT, PYTHON, PIP_ARGV, VENV_PYTHON, ENV_PATH, header, run, set_env_batch, load_env
 
 MODELS_DIR = ROOT / "models"
 
@@ -65,60 +73,234 @@ def _yes_no(prompt: str, default: bool = True) -> bool:
 
 # ── CUDA Detection ───────────────────────────────────────────
 
-def _detect_cuda_tag() -> str | None:
-    """Detect the best CUDA wheel tag for this machine.
+# Detection spawns a python subprocess and nvidia-smi; the answer can't
+# change mid-run, so probe once and reuse it for every install step.
+_UNSET = object()
+_cuda_tag_cache = _UNSET
+_cuda_tag_lock = threading.Lock()
+
+# A found CUDA tag also rarely changes between runs, so it is persisted to
+# disk for a day.  "No NVIDIA GPU" is never persisted: the fix for it is
+# installing a driver and re-running, which must probe again.  The
+# snapshot is keyed by the installed torch version (the probe's first
+# source), so a torch swap by pip invalidates it.  ARCHI_HW_REPROBE=1
+# forces a fresh probe.
+HW_CACHE_PATH = Path(os.environ.get("ARCHI_HW_CACHE_PATH")
+                     or ROOT / "data" / "hw_cache.json")
+HW_CACHE_TTL = 24 * 60 * 60
+
+
+def _load_hw_cache() -> str | None | object:
+    """Return the persisted CUDA tag, or _UNSET if missing/stale/foreign."""
+    if os.environ.get("ARCHI_HW_REPROBE") == "1":
+        return _UNSET
+    try:
+        if time.time() - HW_CACHE_PATH.stat().st_mtime > HW_CACHE_TTL:
+            return _UNSET
+        data = json.loads(HW_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return _UNSET
+    # A different interpreter (e.g. a rebuilt venv) may carry another torch
+    if not isinstance(data, dict) or data.get("python") != str(PYTHON):
+        return _UNSET
+    if data.get("torch") != _probe_torch()[0]:
+        return _UNSET
+    tag = data.get("cuda_tag")
+    return tag if isinstance(tag, str) and tag else _UNSET
+
+
+def _save_hw_cache(tag: str | None) -> None:
+    """Persist a found CUDA tag; failures only cost a re-probe next run."""
+    if not tag:
+        _clear_hw_cache()
+        return
+    try:
+        HW_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        HW_CACHE_PATH.write_text(
+            json.dumps({"python": str(PYTHON), "torch": _probe_torch()[0],
+                        "cuda_tag": tag}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
 
-    Priority:
-    1. Existing torch CUDA install (e.g. "cu128") — preserve what works.
-    2. nvidia-smi CUDA version — pick the right wheels for fresh installs.
-    3. None — no NVIDIA GPU, use CPU builds from default PyPI.
+
+def _clear_hw_cache() -> None:
+    """Drop the persisted CUDA tag so the next run probes afresh."""
+    try:
+        HW_CACHE_PATH.unlink()
+    except OSError:
+        pass
+
+
+def _detect_cuda_tag(force_refresh: bool = False) -> str | None:
+    """Return the CUDA wheel tag for this machine, probing only once.
+
+    The result is reused from the on-disk cache when it is fresh.  Pass
+    ``force_refresh=True`` to discard both caches and re-probe.
     """
-    # Check existing torch first
+    global _cuda_tag_cache
+    if not force_refresh and _cuda_tag_cache is not _UNSET:
+        return _cuda_tag_cache
+    with _cuda_tag_lock:
+        if not force_refresh and _cuda_tag_cache is _UNSET:
+            _cuda_tag_cache = _load_hw_cache()
+        if force_refresh or _cuda_tag_cache is _UNSET:
+            _cuda_tag_cache = _probe_cuda_tag()
+            _save_hw_cache(_cuda_tag_cache)
+    return _cuda_tag_cache
+
+
+def _site_packages() -> list[str] | None:
+    """Return PYTHON's site-packages dirs without launching it.
+
+    None means the layout isn't recognised and the caller should ask the
+    interpreter itself.
+    """
+    if PYTHON == sys.executable:
+        return sys.path
+    venv = VENV_PYTHON.parent.parent
+    if sys.platform == "win32":
+        dirs = [venv / "Lib" / "site-packages"]
+    else:
+        dirs = sorted(venv.glob("lib/python3.*/site-packages"))
+    dirs = [str(d) for d in dirs if d.is_dir()]
+    return dirs or None
+
+
+# Present in torch/lib only for CUDA builds of torch
+_TORCH_CUDA_LIBS = ("torch_cuda.dll", "libtorch_cuda.so")
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_torch() -> tuple[str, bool]:
+    """Return (torch version, torch is a CUDA build) for PYTHON.
+
+    Read from the installed package metadata and the torch/lib directory,
+    so torch (seconds to import) is never loaded.  Falls back to a single
+    interpreter launch when PYTHON's site-packages can't be located.
+    Returns ("", False) when torch is not installed.  Call
+    ``_probe_torch.cache_clear()`` after pip changes the environment.
+    """
+    site = _site_packages()
+    if site is not None:
+        dist = next(iter(importlib.metadata.distributions(name="torch", path=site)), None)
+        if dist is None:
+            return "", False
+        version = dist.version
+        if "+cpu" in version:
+            return version, False
+        lib_dir = Path(dist.locate_file("torch")) / "lib"
+        return version, any((lib_dir / name).is_file() for name in _TORCH_CUDA_LIBS)
+
     try:
         result = subprocess.run(
-            f'"{PYTHON}" -c "import torch; print(torch.__version__)"',
-            shell=True, capture_output=True, text=True, cwd=str(ROOT),
+            [PYTHON, "-c",
+             "import torch; print(torch.__version__); print(torch.cuda.is_available())"],
+            capture_output=True, text=True, cwd=str(ROOT),
         )
-        version = result.stdout.strip()
-        if "+cu" in version:
-            tag = version.split("+")[1]
-            print(f"  Detected existing torch CUDA build: {tag}")
-            return tag
+        lines = result.stdout.split()
+        if result.returncode == 0 and len(lines) >= 2:
+            return lines[0], lines[1] == "True"
     except Exception:
         pass
+    return "", False
+
+
+def _nvidia_driver_version() -> str | None:
+    """Return the NVIDIA driver version string, or None without a GPU.
+
+    Queries NVML in-process when nvidia-ml-py (``pynvml``) is importable,
+    which avoids forking nvidia-smi and re-initialising the driver.  Falls
+    back to nvidia-smi otherwise.
+    """
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        try:
+            driver = pynvml.nvmlSystemGetDriverVersion()
+        finally:
+            pynvml.nvmlShutdown()
+        return driver.decode() if isinstance(driver, bytes) else driver
+    except Exception:
+        pass  # not installed or no driver loaded — try nvidia-smi
 
-    # No CUDA torch installed — probe the GPU via nvidia-smi
     try:
         result = subprocess.run(
-            "nvidia-smi --query-gpu=driver_version --format=csv,noheader",
-            shell=True, capture_output=True, text=True,
+            ["nvidia-smi", "--query-gpu=driver_version", "--format=csv,noheader"],
+            capture_output=True, text=True,
         )
         if result.returncode == 0 and result.stdout.strip():
-            driver = result.stdout.strip().split("\n")[0]
-            major = int(driver.split(".")[0])
-            # Driver >=570 supports CUDA 12.8, >=560 supports 12.6
-            if major >= 570:
-                tag = "cu128"
-            elif major >= 560:
-                tag = "cu126"
-            else:
-                print(f"  NVIDIA driver {driver} is too old for current CUDA wheels.")
-                print("  Update your driver or torch will fall back to CPU.")
-                return None
-            print(f"  Detected NVIDIA GPU (driver {driver}) -> using {tag} wheels")
-            return tag
+            return result.stdout.strip().split("\n")[0]
     except Exception:
         pass
+    return None
+
+
+def _probe_cuda_tag() -> str | None:
+    """Detect the best CUDA wheel tag for this machine.
+
+    Priority:
+    1. Existing torch CUDA install (e.g. "cu128") — preserve what works.
+    2. NVIDIA driver version — pick the right wheels for fresh installs.
+    3. None — no NVIDIA GPU, use CPU builds from default PyPI.
+    """
+    # Check existing torch first
+    version, _ = _probe_torch()
+    if "+cu" in version:
+        tag = version.split("+")[1]
+        print(f"  Detected existing torch CUDA build: {tag}")
+        return tag
+
+    # No CUDA torch installed — probe the GPU driver
+    driver = _nvidia_driver_version()
+    if driver:
+        try:
+            major = int(driver.split(".")[0])
+        except ValueError:
+            return None
+        # Driver >=570 supports CUDA 12.8, >=560 supports 12.6
+        if major >= 570:
+            tag = "cu128"
+        elif major >= 560:
+            tag = "cu126"
+        else:
+            print(f"  NVIDIA driver {driver} is too old for current CUDA wheels.")
+            print("  Update your driver or torch will fall back to CPU.")
+            return None
+        print(f"  Detected NVIDIA GPU (driver {driver}) -> using {tag} wheels")
+        return tag
 
     return None
 
 
-def _pip_extra_index() -> str:
-    """Return '--extra-index-url ...' for CUDA wheels, or '' for CPU."""
+def _pip_extra_index() -> list[str]:
+    """Return ['--extra-index-url', ...] for CUDA wheels, or [] for CPU."""
     tag = _detect_cuda_tag()
     if tag:
-        return f" --extra-index-url https://download.pytorch.org/whl/{tag}"
-    return ""
+        return ["--extra-index-url", f"https://download.pytorch.org/whl/{tag}"]
+    return []
+
+
+def _pip_install(packages: list[str], index_url: str | None = None,
+                 force_reinstall: bool = False, no_deps: bool = False) -> int:
+    """Install *packages* into the venv with a single pip invocation.
+
+    Every pip run pays interpreter start-up plus a full dependency
+    resolve, so each install step passes all of its packages at once.
+    Without *index_url* the CUDA wheel index is added as an extra index
+    (torch dependencies keep their CUDA build); with it, that index is
+    used instead of PyPI.
+    """
+    cmd = [*PIP_ARGV, "install", *packages]
+    if force_reinstall:
+        cmd.append("--force-reinstall")
+    if no_deps:
+        cmd.append("--no-deps")
+    cmd += ["--index-url", index_url] if index_url else _pip_extra_index()
+    rc = run(cmd)
+    _probe_torch.cache_clear()  # the torch build may have changed
+    return rc
 
 
 # ── First-Time Setup (Onboarding) ────────────────────────────
@@ -221,13 +403,16 @@ def _setup_env() -> None:
             ENV_PATH.write_text("# Archi environment\n", encoding="utf-8")
             print("  Created empty .env")
 
+    # Answers are collected and written to .env in one go at the end
+    updates = {}
+
     # OpenRouter key (required)
     print("\n  --- OpenRouter API Key (required) ---")
     print("  Get one at: https://openrouter.ai/keys")
     print("  This powers all AI inference. Free tier available.\n")
     key = _input("OpenRouter API key (or press Enter to skip)")
     if key and key != "sk-or-replace-with-your-key":
-        set_env("OPENROUTER_API_KEY", key)
+        updates["OPENROUTER_API_KEY"] = key
 
     # xAI direct key (optional, recommended)
     print("\n  --- xAI Direct API Key (optional, recommended) ---")
@@ -235,7 +420,7 @@ def _setup_env() -> None:
     print("  Enables direct routing to Grok (faster, avoids OpenRouter overhead).\n")
     key = _input("xAI API key (or press Enter to skip)")
     if key:
-        set_env("XAI_API_KEY", key)
+        updates["XAI_API_KEY"] = key
 
     # Discord bot token
     print("\n  --- Discord Bot Token (required for Discord interface) ---")
@@ -246,11 +431,15 @@ def _setup_env() -> None:
     print("  Copy the bot token below.\n")
     token = _input("Discord bot token (or press Enter to skip)")
     if token and token != "your_bot_token":
-        set_env("DISCORD_BOT_TOKEN", token)
+        updates["DISCORD_BOT_TOKEN"] = token
 
     owner = _input("Your Discord user ID (or press Enter to skip)")
     if owner and owner != "your_discord_user_id":
-        set_env("DISCORD_OWNER_ID", owner)
+        updates["DISCORD_OWNER_ID"] = owner
+
+    if updates:
+        print()
+        set_env_batch(updates)
 
     print("\n  .env configured. You can edit it later at any time.")
     print("  OK")
@@ -459,84 +648,171 @@ def install_deps() -> None:
     # sentence-transformers depends on torch. Without the CUDA index,
     # pip pulls the CPU build from PyPI and silently clobbers any
     # existing CUDA install. Always pass the right index.
-    extra = _pip_extra_index()
-    if extra:
+    if _detect_cuda_tag():
         print(f"  Using CUDA wheel index to prevent CPU-only torch install.\n")
-    run(f'"{PYTHON}" -m pip install -r "{req_file}"{extra}')
+    _pip_install(["-r", str(req_file)])
 
     print("\n  Core dependencies installed.")
 
 
+# ── Hugging Face ─────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=1)
+def _hf_hub():
+    """Import huggingface_hub once, with its environment configured first.
+
+    huggingface_hub reads its settings from the environment at import
+    time, so they must be set before the first import.  hf_transfer
+    (Rust, parallel ranged GETs) errors if enabled but missing, so it is
+    only opted into when installed.
+    """
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    import huggingface_hub
+    return huggingface_hub
+
+
+def _link_or_copy(src: str, dst: Path) -> None:
+    """Hardlink *src* (a cached download) to *dst*, copying across volumes."""
+    src = os.path.realpath(src)  # cache snapshots are symlinks to blobs
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 # ── Voice Dependencies ───────────────────────────────────────
 
-def install_voice() -> None:
+# A real Piper voice model is ~60 MB; anything smaller is a partial download.
+PIPER_MIN_ONNX_BYTES = 1_000_000
+
+
+def _hf_file_sizes(repo_id: str, paths: list[str], revision: str) -> dict[str, int]:
+    """Return {path: size in bytes} for *paths* on the Hub, or {} offline."""
+    try:
+        infos = _hf_hub().HfApi().get_paths_info(repo_id, paths, revision=revision)
+    except Exception:
+        return {}
+    return {info.path: info.size for info in infos
+            if getattr(info, "size", None) is not None}
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Return ``path.stat()``, or None if it doesn't exist (one syscall)."""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _piper_voice_size(onnx_file: Path, json_file: Path,
+                      expected: dict[Path, int] | None = None) -> int | None:
+    """Return the model's size when both voice files are complete, else None.
+
+    With *expected* (sizes from the Hub) the sizes must match exactly, so
+    an interrupted download is never mistaken for a finished one.
+    Without it (offline) only an obviously truncated model is caught.
+    """
+    onnx_st, json_st = _stat_or_none(onnx_file), _stat_or_none(json_file)
+    if onnx_st is None or json_st is None:
+        return None
+    sizes = {onnx_file: onnx_st.st_size, json_file: json_st.st_size}
+    if expected and all(f in expected for f in sizes):
+        ok = all(sizes[f] == expected[f] for f in sizes)
+    else:
+        ok = sizes[onnx_file] >= PIPER_MIN_ONNX_BYTES and sizes[json_file] > 0
+    return sizes[onnx_file] if ok else None
+
+
+def _install_voice_packages() -> None:
     header("Installing Voice Dependencies")
     print("  STT: faster-whisper (CTranslate2-based Whisper)")
     print("  TTS: piper-tts (lightweight ONNX)")
     print("  Audio: sounddevice + numpy (bundles PortAudio, no C compiler needed)\n")
 
-    # Preserve CUDA torch (faster-whisper can pull torch transitively)
-    extra = _pip_extra_index()
-    run(f'"{PYTHON}" -m pip install faster-whisper piper-tts sounddevice numpy{extra}')
+    # Preserve CUDA torch (faster-whisper can pull torch transitively).
+    # huggingface_hub + hf_transfer fetch the voice model below.
+    _pip_install(["faster-whisper", "piper-tts", "sounddevice", "numpy",
+                  "huggingface_hub", "hf_transfer"])
+    importlib.invalidate_caches()  # let find_spec see what pip just added
 
-    # Piper voice model
+
+def _fetch_piper_voice() -> None:
+    """Download the Piper voice model into models/piper."""
     piper_dir = MODELS_DIR / "piper"
     piper_dir.mkdir(parents=True, exist_ok=True)
     voice_name = "en_US-lessac-medium"
     onnx_file = piper_dir / f"{voice_name}.onnx"
     json_file = piper_dir / f"{voice_name}.onnx.json"
 
-    if onnx_file.exists() and json_file.exists():
+    hf_repo = "rhasspy/piper-voices"
+    hf_revision = "v1.0.0"
+    hf_onnx = f"en/en_US/lessac/medium/{voice_name}.onnx"
+    hf_json = f"en/en_US/lessac/medium/{voice_name}.onnx.json"
+    # One metadata call gives the exact sizes to verify local files against
+    hub_sizes = _hf_file_sizes(hf_repo, [hf_onnx, hf_json], hf_revision)
+    expected = {target: hub_sizes[hf_file]
+                for hf_file, target in ((hf_onnx, onnx_file), (hf_json, json_file))
+                if hf_file in hub_sizes}
+
+    if _piper_voice_size(onnx_file, json_file, expected) is not None:
         print(f"\n  Piper voice already downloaded: {voice_name}")
-    else:
-        print(f"\n  Downloading Piper voice: {voice_name} from Hugging Face...")
-        hf_repo = "rhasspy/piper-voices"
-        hf_revision = "v1.0.0"
-        hf_onnx = f"en/en_US/lessac/medium/{voice_name}.onnx"
-        hf_json = f"en/en_US/lessac/medium/{voice_name}.onnx.json"
-        try:
-            from huggingface_hub import hf_hub_download
+        return
 
-            print(f"  Downloading {voice_name}.onnx...")
-            hf_hub_download(
-                repo_id=hf_repo, filename=hf_onnx, revision=hf_revision,
-                local_dir=str(piper_dir), local_dir_use_symlinks=False,
-            )
-            nested_onnx = piper_dir / hf_onnx
-            if nested_onnx.exists() and not onnx_file.exists():
-                shutil.move(str(nested_onnx), str(onnx_file))
-
-            print(f"  Downloading {voice_name}.onnx.json...")
-            hf_hub_download(
-                repo_id=hf_repo, filename=hf_json, revision=hf_revision,
-                local_dir=str(piper_dir), local_dir_use_symlinks=False,
+    print(f"\n  Downloading Piper voice: {voice_name} from Hugging Face...")
+    # Drop partial leftovers so they don't block the link below
+    for partial in (onnx_file, json_file):
+        partial.unlink(missing_ok=True)
+    try:
+        hf_hub_download = _hf_hub().hf_hub_download
+
+        def fetch(hf_file: str, target: Path) -> None:
+            # Download into the HF cache (a re-run finds it there) and
+            # link the blob into place instead of rebuilding the repo's
+            # en/en_US/... tree under piper_dir and moving files out.
+            cached = hf_hub_download(
+                repo_id=hf_repo, filename=hf_file, revision=hf_revision,
+                etag_timeout=30,
             )
-            nested_json = piper_dir / hf_json
-            if nested_json.exists() and not json_file.exists():
-                shutil.move(str(nested_json), str(json_file))
-
-            nested_dir = piper_dir / "en"
-            if nested_dir.is_dir():
-                shutil.rmtree(str(nested_dir), ignore_errors=True)
-
-        except Exception as e:
-            print(f"  Download error: {e}")
+            _link_or_copy(cached, target)
+
+        # Fetch model and config concurrently; the small JSON rides
+        # inside the model's transfer window instead of after it.
+        print(f"  Downloading {voice_name}.onnx and .onnx.json...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(fetch, hf_file, target)
+                for hf_file, target in ((hf_onnx, onnx_file), (hf_json, json_file))
+            ]
+            for future in futures:
+                future.result()
+
+    except Exception as e:
+        print(f"  Download error: {e}")
+
+    onnx_size = _piper_voice_size(onnx_file, json_file, expected)
+    if onnx_size is not None:
+        print(f"  Piper voice downloaded: {voice_name} ({onnx_size / (1024**2):.1f} MB)")
+    else:
+        print(
+            f"  [NOTE] Auto-download may have failed. Download manually:\n"
+            f"    https://huggingface.co/rhasspy/piper-voices/tree/v1.0.0/en/en_US/lessac/medium\n"
+            f"    Place {voice_name}.onnx and {voice_name}.onnx.json in:\n"
+            f"    {piper_dir}"
+        )
 
-        if onnx_file.exists() and json_file.exists():
-            size_mb = onnx_file.stat().st_size / (1024**2)
-            print(f"  Piper voice downloaded: {voice_name} ({size_mb:.1f} MB)")
-        else:
-            print(
-                f"  [NOTE] Auto-download may have failed. Download manually:\n"
-                f"    https://huggingface.co/rhasspy/piper-voices/tree/v1.0.0/en/en_US/lessac/medium\n"
-                f"    Place {voice_name}.onnx and {voice_name}.onnx.json in:\n"
-                f"    {piper_dir}"
-            )
 
+def _voice_done() -> None:
     print("\n  To enable voice, set ARCHI_VOICE_ENABLED=true in .env")
     print("  Voice dependencies installed.")
 
 
+def install_voice() -> None:
+    _install_voice_packages()
+    _fetch_piper_voice()
+    _voice_done()
+
+
 # ── Image Generation Dependencies ────────────────────────────
 
 def install_imagegen() -> None:
@@ -545,20 +821,22 @@ def install_imagegen() -> None:
     cuda_tag = _detect_cuda_tag()
 
     print("  Checking PyTorch CUDA support...")
-    torch_cuda_ok = False
-    try:
-        check = subprocess.run(
-            f'"{PYTHON}" -c "import torch; print(torch.cuda.is_available())"',
-            shell=True, capture_output=True, text=True, cwd=str(ROOT),
-        )
-        torch_cuda_ok = "True" in check.stdout
-    except Exception:
-        pass
+    # A CUDA build only helps with a GPU to run on (cuda_tag is None
+    # when there is neither a CUDA torch tag nor an NVIDIA driver)
+    _, torch_cuda_build = _probe_torch()
+    torch_cuda_ok = torch_cuda_build and cuda_tag is not None
 
     if not torch_cuda_ok:
         if cuda_tag:
             print(f"  NVIDIA GPU detected but torch lacks CUDA. Installing torch+{cuda_tag}...")
-            run(f'"{PYTHON}" -m pip install torch torchvision --force-reinstall --index-url https://download.pytorch.org/whl/{cuda_tag}')
+            torch_index = f"https://download.pytorch.org/whl/{cuda_tag}"
+            # Force-reinstall only torch itself: its pure-Python deps
+            # (sympy, networkx, jinja2, ...) are already fine, and
+            # --force-reinstall would download and rewrite all of them too.
+            _pip_install(["torch", "torchvision"], force_reinstall=True,
+                         no_deps=True, index_url=torch_index)
+            # Plain pass to add any dependency the CUDA build needs that's missing
+            _pip_install(["torch", "torchvision"], index_url=torch_index)
         else:
             print("  No NVIDIA GPU detected -- image gen will be CPU-only (very slow).")
             print("  If you do have an NVIDIA GPU, ensure drivers are installed and")
@@ -572,8 +850,7 @@ def install_imagegen() -> None:
     print("  Accel:     accelerate (GPU inference)")
     print("  Loader:    safetensors (safe model loading)\n")
 
-    extra = _pip_extra_index()
-    run(f'"{PYTHON}" -m pip install diffusers transformers accelerate safetensors{extra}')
+    _pip_install(["diffusers", "transformers", "accelerate", "safetensors"])
 
     print("\n  Image generation dependencies installed.")
     print()
@@ -591,6 +868,94 @@ def install_imagegen() -> None:
 
 # ── Windows Auto-Start ───────────────────────────────────────
 
+AUTOSTART_TASK = "ArchiAutoStart"
+
+# Task Scheduler definition for the headless layer.  schtasks' own flags
+# can't express the battery or execution-limit settings (its defaults
+# would stop Archi on battery and kill it after 72 h), so the task is
+# registered from XML: S4U runs it at boot without a stored password.
+_AUTOSTART_TASK_XML = """\
+<?xml version="1.0" encoding="UTF-16"?>
+<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <RegistrationInfo>
+    <Description>Start Archi AI agent headless at boot</Description>
+  </RegistrationInfo>
+  <Triggers>
+    <BootTrigger>
+      <Enabled>true</Enabled>
+      <Delay>PT30S</Delay>
+    </BootTrigger>
+  </Triggers>
+  <Principals>
+    <Principal id="Author">
+      <UserId>{user}</UserId>
+      <LogonType>S4U</LogonType>
+      <RunLevel>LeastPrivilege</RunLevel>
+    </Principal>
+  </Principals>
+  <Settings>
+    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
+    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
+    <StartWhenAvailable>true</StartWhenAvailable>
+    <ExecutionTimeLimit>P365D</ExecutionTimeLimit>
+  </Settings>
+  <Actions Context="Author">
+    <Exec>
+      <Command>{command}</Command>
+      <WorkingDirectory>{workdir}</WorkingDirectory>
+    </Exec>
+  </Actions>
+</Task>
+"""
+
+
+def _startup_folder() -> Path:
+    """Per-user Startup folder (what WScript.Shell's "Startup" resolves to)."""
+    return (Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+            / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup")
+
+
+def _register_autostart_task(headless_bat: Path) -> int:
+    """Register the boot-time task with schtasks.exe; return its exit code."""
+    from xml.sax.saxutils import escape
+
+    user = f'{os.environ.get("USERDOMAIN", "")}\\{os.environ.get("USERNAME", "")}'
+    xml_path = ROOT / "scripts" / "_autostart_task.xml"
+    # schtasks /XML only reads from a file, and expects UTF-16
+    xml_path.write_text(
+        _AUTOSTART_TASK_XML.format(
+            user=escape(user), command=escape(str(headless_bat)),
+            workdir=escape(str(ROOT)),
+        ),
+        encoding="utf-16",
+    )
+    try:
+        # /F replaces an existing registration in place
+        return run(["schtasks", "/Create", "/TN", AUTOSTART_TASK,
+                    "/XML", str(xml_path), "/F"], check=False)
+    finally:
+        xml_path.unlink(missing_ok=True)
+
+
+def _create_startup_shortcut(monitor_bat: Path, lnk_path: Path) -> int:
+    """Create the Startup-folder .lnk; return the exit code."""
+    # .lnk files are only writable through the WScript.Shell COM object, so
+    # PowerShell stays for this one step -- inline, without a temp script.
+    def ps_quote(value: object) -> str:
+        return "'" + str(value).replace("'", "''") + "'"
+
+    script = (
+        f"$lnk = (New-Object -ComObject WScript.Shell).CreateShortcut({ps_quote(lnk_path)}); "
+        f"$lnk.TargetPath = {ps_quote(monitor_bat)}; "
+        f"$lnk.WorkingDirectory = {ps_quote(ROOT)}; "
+        f"$lnk.Description = 'Archi AI Agent Monitor'; "
+        f"$lnk.WindowStyle = 1; "
+        f"$lnk.Save()"
+    )
+    return run(["powershell", "-NoProfile", "-NonInteractive", "-Command", script],
+               check=False)
+
+
 def setup_autostart(auto: bool = False) -> None:
     header("Windows Auto-Start Setup")
     if sys.platform != "win32":
@@ -610,6 +975,8 @@ def setup_autostart(auto: bool = False) -> None:
 
         choice = input("Select (1/2/S): ").strip().upper()
 
+    lnk_path = _startup_folder() / "Archi.lnk"
+
     if choice == "1":
         (ROOT / "logs").mkdir(exist_ok=True)
         headless_bat = ROOT / "scripts" / "startup_archi_headless.bat"
@@ -623,75 +990,19 @@ def setup_autostart(auto: bool = False) -> None:
             return
 
         print("\n  Setting up Layer 1: Task Scheduler (headless at boot)...")
-        task_name = "ArchiAutoStart"
-        temp_ps1 = ROOT / "scripts" / "_setup_autostart.ps1"
-        temp_ps1.write_text(
-            f'$ErrorActionPreference = "Stop"\n'
-            f'$action = New-ScheduledTaskAction '
-            f'-Execute "{headless_bat}" '
-            f'-WorkingDirectory "{ROOT}"\n'
-            f'$trigger = New-ScheduledTaskTrigger -AtStartup\n'
-            f'$trigger.Delay = "PT30S"\n'
-            f'$principal = New-ScheduledTaskPrincipal '
-            f'-UserId "$env:USERDOMAIN\\$env:USERNAME" '
-            f'-LogonType S4U '
-            f'-RunLevel Limited\n'
-            f'$settings = New-ScheduledTaskSettingsSet '
-            f'-AllowStartIfOnBatteries '
-            f'-DontStopIfGoingOnBatteries '
-            f'-StartWhenAvailable '
-            f'-ExecutionTimeLimit (New-TimeSpan -Days 365)\n'
-            f'Unregister-ScheduledTask -TaskName "{task_name}" '
-            f'-Confirm:$false -ErrorAction SilentlyContinue\n'
-            f'Register-ScheduledTask -TaskName "{task_name}" '
-            f'-Action $action -Trigger $trigger '
-            f'-Principal $principal -Settings $settings '
-            f'-Description "Start Archi AI agent headless at boot"\n'
-            f'Write-Host "Task Scheduler: {task_name} registered." '
-            f'-ForegroundColor Green\n',
-            encoding="utf-8",
-        )
-
-        ts_result = run(
-            f'powershell -ExecutionPolicy Bypass -File "{temp_ps1}"',
-            check=False,
-        )
-        try:
-            temp_ps1.unlink()
-        except OSError:
-            pass
-
-        if ts_result != 0:
+        ts_result = _register_autostart_task(headless_bat)
+        if ts_result == 0:
+            print(f"  Task Scheduler: {AUTOSTART_TASK} registered.")
+        else:
             print("  [WARNING] Task Scheduler setup failed (may need admin).")
             print("  You can retry from an elevated prompt, or Archi will still")
             print("  start via the Startup folder when you log in.")
 
         print("\n  Setting up Layer 2: Startup folder (visible terminal on login)...")
-        temp_ps1 = ROOT / "scripts" / "_setup_startup_shortcut.ps1"
-        temp_ps1.write_text(
-            f'$ws = New-Object -ComObject WScript.Shell\n'
-            f'$startup = $ws.SpecialFolders("Startup")\n'
-            f'$lnk = $ws.CreateShortcut("$startup\\Archi.lnk")\n'
-            f'$lnk.TargetPath = "{monitor_bat}"\n'
-            f'$lnk.WorkingDirectory = "{ROOT}"\n'
-            f'$lnk.Description = "Archi AI Agent Monitor"\n'
-            f'$lnk.WindowStyle = 1\n'
-            f'$lnk.Save()\n'
-            f'Write-Host "Startup folder: Archi.lnk created at $startup" '
-            f'-ForegroundColor Green\n',
-            encoding="utf-8",
-        )
-
-        sf_result = run(
-            f'powershell -ExecutionPolicy Bypass -File "{temp_ps1}"',
-            check=False,
-        )
-        try:
-            temp_ps1.unlink()
-        except OSError:
-            pass
-
-        if sf_result != 0:
+        sf_result = _create_startup_shortcut(monitor_bat, lnk_path)
+        if sf_result == 0:
+            print(f"  Startup folder: Archi.lnk created at {lnk_path.parent}")
+        else:
             print("  [ERROR] Startup folder shortcut failed.")
             print("  Manual fix: Win+R -> shell:startup -> create shortcut to:")
             print(f"  {monitor_bat}")
@@ -707,41 +1018,31 @@ def setup_autostart(auto: bool = False) -> None:
         print("  To disable: run this script and choose option 2.")
 
     elif choice == "2":
-        temp_ps1 = ROOT / "scripts" / "_remove_autostart.ps1"
-        temp_ps1.write_text(
-            '# Remove Startup folder shortcut\n'
-            '$ws = New-Object -ComObject WScript.Shell\n'
-            '$startup = $ws.SpecialFolders("Startup")\n'
-            '$lnk = "$startup\\Archi.lnk"\n'
-            'if (Test-Path $lnk) {\n'
-            '    Remove-Item $lnk -Force\n'
-            '    Write-Host "Removed Archi shortcut from Startup folder." '
-            '-ForegroundColor Green\n'
-            '} else {\n'
-            '    Write-Host "No Archi shortcut found in Startup folder." '
-            '-ForegroundColor Yellow\n'
-            '}\n'
-            '# Remove Task Scheduler entry\n'
-            'Unregister-ScheduledTask -TaskName "ArchiAutoStart" '
-            '-Confirm:$false -ErrorAction SilentlyContinue\n'
-            'Write-Host "Task Scheduler: ArchiAutoStart removed." '
-            '-ForegroundColor Green\n',
-            encoding="utf-8",
-        )
-        run(
-            f'powershell -ExecutionPolicy Bypass -File "{temp_ps1}"',
-            check=False,
-        )
         try:
-            temp_ps1.unlink()
-        except OSError:
-            pass
+            lnk_path.unlink()
+            print("  Removed Archi shortcut from Startup folder.")
+        except FileNotFoundError:
+            print("  No Archi shortcut found in Startup folder.")
+        except OSError as e:
+            print(f"  [WARNING] Could not remove {lnk_path}: {e}")
+        # Exits non-zero when the task was never registered; that's fine
+        run(["schtasks", "/Delete", "/TN", AUTOSTART_TASK, "/F"], check=False)
         print("  Auto-start removed (both layers).")
 
     elif choice != "S":
         print("  Unknown option.")
 
 
+# ── Everything ───────────────────────────────────────────────
+
+def install_all() -> None:
+    """Run every install step in order (menu [A] and ``install.py all``)."""
+    install_deps()
+    install_voice()
+    install_imagegen()
+    setup_autostart(auto=True)
+
+
 # ── Main Menu ────────────────────────────────────────────────
 
 def main_menu() -> None:
@@ -776,10 +1077,7 @@ def main_menu() -> None:
     elif choice == "4":
         setup_autostart()
     elif choice == "A":
-        install_deps()
-        install_voice()
-        install_imagegen()
-        setup_autostart(auto=True)
+        install_all()
     elif choice != "Q":
         print("  Unknown option.")
         main_menu()
@@ -802,10 +1100,7 @@ def main() -> None:
             "autostart": setup_autostart,
         }
         if cmd == "all":
-            install_deps()
-            install_voice()
-            install_imagegen()
-            setup_autostart(auto=True)
+            install_all()
         elif cmd in dispatch:
             dispatch[cmd]()
         else:
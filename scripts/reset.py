@@ -21,21 +21,54 @@ import json
 import os
 import shutil
 import sqlite3
+import stat
 import sys
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from _common import ROOT, BACKUP_ROOT
+from _common import ROOT, BACKUP_ROOT, find_cache_dirs
 
 DATA_DIR = ROOT / "data"
+_DATA_STR = str(DATA_DIR)
 LOGS_DIR = ROOT / "logs"
 WORKSPACE_DIR = ROOT / "workspace"
 RESET_BACKUP_DIR = BACKUP_ROOT / "resets"
 MAX_BACKUPS = 3
 
+# Python cache dirs removed by the reset
+_CACHE_DIR_NAMES = frozenset({"__pycache__", ".pytest_cache"})
+
+# JSON state files reset to empty defaults.
+# user_model.json and project_context.json are only written when the
+# reset options ask for it; cost_usage.json is rebuilt separately.
+_JSON_DEFAULTS: dict[str, bytes] = {
+    name: (json.dumps(default, indent=2) + "\n").encode("utf-8")
+    for name, default in {
+        "goals_state.json":                 {"goals": []},
+        "experiences.json":                 {"experiences": []},
+        "idea_backlog.json":                {"ideas": []},
+        "overnight_results.json":           {},
+        "interesting_findings_queue.json":  [],
+        "user_preferences.json":            {},
+        "file_manifest.json":              {"files": {}},
+        "initiative_state.json":            {},
+        "idea_history.json":                {"version": 1, "last_updated": None, "ideas": []},
+        "user_model.json":                  {"version": 2, "last_updated": None, "facts": [], "preferences": [], "corrections": [], "patterns": [], "style": [], "interests": []},
+        "project_context.json":             {},
+    }.items()
+}
+
 # Track files that couldn't be cleared (locked by running process, etc.)
 _skipped: list = []
+_skipped_lock = threading.Lock()
+
+# Per-thread output buffer, set by _run_buffered() so the clear_* steps
+# can run concurrently without interleaving their banners
+_out = threading.local()
 
 
 # ── Backup ──────────────────────────────────────────────────────────────
@@ -85,66 +118,193 @@ def _prune_old_backups() -> None:
     )
     while len(backups) > MAX_BACKUPS:
         oldest = backups.pop(0)
-        try:
-            shutil.rmtree(str(oldest))
+        failed = _rmtree_keep_going(oldest)
+        if not failed:
             print(f"  Pruned old backup: {oldest.name}")
-        except OSError:
-            pass
+        else:
+            print(f"  Partly pruned old backup: {oldest.name} ({len(failed)} item(s) left)")
+
+
+def _rmtree_keep_going(path: Path) -> list[str]:
+    """shutil.rmtree that carries on past failures; returns the paths left."""
+    failed: list[str] = []
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=lambda func, p, exc: failed.append(os.fspath(p)))
+    else:
+        shutil.rmtree(path, onerror=lambda func, p, exc_info: failed.append(os.fspath(p)))
+    return failed
+
+
+def _say(line: str) -> None:
+    buf = getattr(_out, "lines", None)
+    if buf is None:
+        print(line)
+    else:
+        buf.append(line)
 
 
 def _banner(msg: str) -> None:
-    print(f"  {'✓':>3}  {msg}")
+    _say(f"  {'✓':>3}  {msg}")
+
+
+def _skip(path: str) -> None:
+    with _skipped_lock:
+        _skipped.append(path)
+
+
+def _run_buffered(fn, *args, **kwargs) -> tuple[int, list[str], Exception | None]:
+    """Call *fn*, returning its result, the lines it would have printed and
+    the exception it raised (if any).
+
+    A failure doesn't discard the lines buffered before it, so the caller
+    can still report what was already cleared.
+    """
+    lines = _out.lines = []
+    try:
+        return fn(*args, **kwargs), lines, None
+    except Exception as e:
+        return 0, lines, e
+    finally:
+        _out.lines = None
 
 
-def _safe_delete(path: Path) -> bool:
+def _safe_delete(path: str | os.PathLike) -> bool:
     """Try to delete a file; if locked, truncate it instead."""
     try:
-        path.unlink()
+        os.unlink(path)
         return True
     except (PermissionError, OSError):
         try:
-            path.write_text("", encoding="utf-8")
+            with open(path, "wb"):
+                pass
             return True
         except Exception:
-            _skipped.append(str(path))
+            _skip(os.fspath(path))
             return False
 
 
-def _safe_rmtree(path: Path) -> bool:
-    """Try shutil.rmtree; fall back to clearing files individually."""
+def _write_if_changed(path: str | os.PathLike, data: bytes) -> None:
+    """Write *data* to *path* unless the file already holds exactly that."""
     try:
-        shutil.rmtree(path)
-        return True
-    except (PermissionError, OSError):
-        # Fall back: clear files one by one
-        for item in sorted(path.rglob("*"), reverse=True):
-            if item.is_file():
-                _safe_delete(item)
-            elif item.is_dir() and item != path:
-                try:
-                    item.rmdir()
-                except OSError:
-                    pass
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _is_real_dir(entry: os.DirEntry) -> bool:
+    """True for a directory that isn't a symlink or a Windows junction."""
+    if not entry.is_dir(follow_symlinks=False):
         return False
+    if sys.platform == "win32":
+        # Junctions report as directories; never descend into their target.
+        attrs = entry.stat(follow_symlinks=False).st_file_attributes
+        return not attrs & stat.FILE_ATTRIBUTE_REPARSE_POINT
+    return True
 
 
-# ── Clear functions ──────────────────────────────────────────────────────
+def _scandir_recursive(path: str | Path) -> Iterator[os.DirEntry]:
+    """Yield every entry below *path*, each directory after its contents.
+
+    Unreadable or vanished directories are skipped.
+    """
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if _is_real_dir(entry):
+                yield from _scandir_recursive(entry.path)
+            yield entry
+
+
+# unlinkat()/rmdirat() relative to an open directory fd (POSIX)
+_DIR_FD_OK = ({os.unlink, os.rmdir, os.open} <= os.supports_dir_fd
+              and os.scandir in os.supports_fd)
 
-def clear_logs() -> int:
-    """Delete all log files and subdirectories under logs/."""
-    count = 0
-    if not LOGS_DIR.exists():
-        return count
 
-    for item in sorted(LOGS_DIR.rglob("*"), reverse=True):
-        if item.is_file():
-            if _safe_delete(item):
+def _clear_tree_at(dir_fd: int, dir_path: str) -> int:
+    """_clear_tree() via directory fds; return the files removed."""
+    count = 0
+    with os.scandir(dir_fd) as it:
+        entries = list(it)  # don't unlink under an open directory stream
+    for entry in entries:
+        path = os.path.join(dir_path, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            try:
+                fd = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW,
+                             dir_fd=dir_fd)
+            except OSError:
+                continue
+            try:
+                count += _clear_tree_at(fd, path)
+            finally:
+                os.close(fd)
+            try:
+                os.rmdir(entry.name, dir_fd=dir_fd)
+            except OSError:
+                pass
+        else:
+            try:
+                os.unlink(entry.name, dir_fd=dir_fd)
                 count += 1
-        elif item.is_dir() and item != LOGS_DIR:
+            except OSError:
+                if _safe_delete(path):  # retry by path, then truncate
+                    count += 1
+    return count
+
+
+def _clear_tree(path: str | Path) -> int:
+    """Delete everything below *path* in one pass; return the files removed.
+
+    Locked files are truncated instead (see _safe_delete), and
+    directories that can't be removed are left in place.
+    """
+    if _DIR_FD_OK:
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return 0
+        try:
+            return _clear_tree_at(fd, os.fspath(path))
+        finally:
+            os.close(fd)
+
+    count = 0
+    for entry in _scandir_recursive(path):
+        if entry.is_dir(follow_symlinks=False):
             try:
-                item.rmdir()
+                os.rmdir(entry.path)
             except OSError:
                 pass
+        elif _safe_delete(entry.path):
+            count += 1
+    return count
+
+
+def _safe_rmtree(path: Path) -> int:
+    """Delete the tree at *path*, itself included; return the files removed."""
+    count = _clear_tree(path)
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+    return count
+
+
+# ── Clear functions ──────────────────────────────────────────────────────
+
+def clear_logs() -> int:
+    """Delete all log files and subdirectories under logs/."""
+    if not LOGS_DIR.exists():
+        return 0
+
+    count = _clear_tree(LOGS_DIR)
     _banner(f"Logs cleared ({count} files)")
     return count
 
@@ -153,59 +313,45 @@ def clear_data_runtime(clear_project_context: bool = False,
                        keep_user_model: bool = False) -> int:
     """Clear runtime data files while preserving directory structure."""
     count = 0
-    if not DATA_DIR.exists():
+    try:
+        with os.scandir(DATA_DIR) as it:
+            present = {entry.name: entry for entry in it}
+    except FileNotFoundError:
         return count
 
-    # JSON state files → reset to empty defaults
-    json_resets = {
-        "goals_state.json":                 {"goals": []},
-        "experiences.json":                 {"experiences": []},
-        "idea_backlog.json":                {"ideas": []},
-        "overnight_results.json":           {},
-        "interesting_findings_queue.json":  [],
-        "user_preferences.json":            {},
-        "file_manifest.json":              {"files": {}},
-        "cost_usage.json":                 None,  # special handling below
-        "initiative_state.json":            {},
-        "idea_history.json":                {"version": 1, "last_updated": None, "ideas": []},
-    }
+    json_resets = dict(_JSON_DEFAULTS)
 
     # User model: only wipe if not explicitly kept
     if keep_user_model:
-        um_path = DATA_DIR / "user_model.json"
-        if um_path.exists():
+        del json_resets["user_model.json"]
+        if "user_model.json" in present:
             _banner("user_model.json preserved (learned preferences, facts, corrections)")
-    else:
-        json_resets["user_model.json"] = {"version": 2, "last_updated": None, "facts": [], "preferences": [], "corrections": [], "patterns": [], "style": [], "interests": []}
 
     # Project context: only clear if explicitly requested
     if clear_project_context:
-        json_resets["project_context.json"] = {}
         _banner("project_context.json will be cleared")
     else:
-        ctx_path = DATA_DIR / "project_context.json"
-        if ctx_path.exists():
+        del json_resets["project_context.json"]
+        if "project_context.json" in present:
             _banner("project_context.json preserved (projects, interests, focus areas)")
-    for filename, default in json_resets.items():
-        fpath = DATA_DIR / filename
-        if default is None:
-            continue  # handled separately below
+    for filename, blob in json_resets.items():
+        fpath = os.path.join(_DATA_STR, filename)
         try:
-            fpath.write_text(json.dumps(default, indent=2) + "\n", encoding="utf-8")
+            _write_if_changed(fpath, blob)
             count += 1
         except Exception:
-            _skipped.append(str(fpath))
+            _skip(fpath)
 
     # cost_usage.json: reset daily usage but PRESERVE monthly totals
     # so a reset mid-month doesn't hide accumulated spend from budget enforcement
     cost_path = DATA_DIR / "cost_usage.json"
     try:
         monthly = {}
-        if cost_path.exists():
+        if "cost_usage.json" in present:
             old = json.loads(cost_path.read_text(encoding="utf-8"))
             monthly = old.get("monthly_usage", {})
         reset_cost = {"usage": {}, "daily_usage": {}, "monthly_usage": monthly}
-        cost_path.write_text(json.dumps(reset_cost, indent=2) + "\n", encoding="utf-8")
+        _write_if_changed(cost_path, (json.dumps(reset_cost, indent=2) + "\n").encode("utf-8"))
         count += 1
         if monthly:
             total = sum(monthly.values())
@@ -213,46 +359,54 @@ def clear_data_runtime(clear_project_context: bool = False,
         else:
             _banner("cost_usage.json reset")
     except Exception:
-        _skipped.append(str(cost_path))
+        _skip(str(cost_path))
 
-    _banner(f"JSON state files reset to defaults ({len(json_resets)} files)")
+    # (+1: cost_usage.json above)
+    _banner(f"JSON state files reset to defaults ({len(json_resets) + 1} files)")
 
-    # JSONL files → truncate
-    for fpath in DATA_DIR.glob("*.jsonl"):
+    by_suffix: dict[str, list[os.DirEntry]] = {".jsonl": [], ".backup": [], ".db": []}
+    for name, entry in present.items():
+        suffix = os.path.splitext(name)[1]
+        if suffix in by_suffix and entry.is_file():
+            by_suffix[suffix].append(entry)
+
+    # JSONL files → truncate (already-empty ones are left alone)
+    for entry in by_suffix[".jsonl"]:
         try:
-            fpath.write_text("", encoding="utf-8")
+            if entry.stat().st_size:
+                os.truncate(entry.path, 0)
             count += 1
         except Exception:
-            _skipped.append(str(fpath))
+            _skip(entry.path)
     _banner("JSONL logs truncated (dream_log, etc.)")
 
     # Chat history (JSON)
     chat_hist = DATA_DIR / "chat_history.json"
-    if chat_hist.exists():
+    if "chat_history.json" in present:
         try:
-            chat_hist.write_text("[]", encoding="utf-8")
+            _write_if_changed(chat_hist, b"[]")
             count += 1
             _banner("chat_history.json reset")
         except Exception:
-            _skipped.append(str(chat_hist))
+            _skip(str(chat_hist))
 
     # Backup files (*.backup)
     backup_count = 0
-    for fpath in DATA_DIR.glob("*.backup"):
-        if _safe_delete(fpath):
+    for entry in by_suffix[".backup"]:
+        if _safe_delete(entry.path):
             backup_count += 1
     if backup_count:
         _banner(f"Backup files removed ({backup_count})")
     count += backup_count
 
     # SQLite databases → clear all rows, keep schema
-    for db_file in DATA_DIR.glob("*.db"):
-        _clear_sqlite(db_file)
+    for entry in by_suffix[".db"]:
+        _clear_sqlite(Path(entry.path))
         count += 1
 
     # Cache directory
     cache_dir = DATA_DIR / "cache"
-    if cache_dir.exists():
+    if "cache" in present:
         _safe_rmtree(cache_dir)
         cache_dir.mkdir(parents=True, exist_ok=True)
         count += 1
@@ -260,7 +414,7 @@ def clear_data_runtime(clear_project_context: bool = False,
 
     # Plan state directory
     plan_dir = DATA_DIR / "plan_state"
-    if plan_dir.exists():
+    if "plan_state" in present:
         _safe_rmtree(plan_dir)
         plan_dir.mkdir(parents=True, exist_ok=True)
         count += 1
@@ -268,16 +422,15 @@ def clear_data_runtime(clear_project_context: bool = False,
 
     # Source backups directory
     backups_dir = DATA_DIR / "source_backups"
-    if backups_dir.exists():
-        bak_count = sum(1 for f in backups_dir.iterdir() if f.is_file())
-        _safe_rmtree(backups_dir)
+    if "source_backups" in present:
+        bak_count = _safe_rmtree(backups_dir)
         backups_dir.mkdir(parents=True, exist_ok=True)
         count += bak_count
         _banner(f"Source backups cleared ({bak_count} files)")
 
     # Vector store (LanceDB)
     vectors_dir = DATA_DIR / "vectors"
-    if vectors_dir.exists():
+    if "vectors" in present:
         _safe_rmtree(vectors_dir)
         vectors_dir.mkdir(parents=True, exist_ok=True)
         count += 1
@@ -285,9 +438,8 @@ def clear_data_runtime(clear_project_context: bool = False,
 
     # Uploaded files
     uploads_dir = DATA_DIR / "uploads"
-    if uploads_dir.exists():
-        upload_count = sum(1 for f in uploads_dir.iterdir() if f.is_file())
-        _safe_rmtree(uploads_dir)
+    if "uploads" in present:
+        upload_count = _safe_rmtree(uploads_dir)
         uploads_dir.mkdir(parents=True, exist_ok=True)
         count += upload_count
         if upload_count:
@@ -295,41 +447,129 @@ def clear_data_runtime(clear_project_context: bool = False,
 
     # Tool manifest (regenerated at runtime)
     manifest = DATA_DIR / "tool_manifest.yaml"
-    if manifest.exists():
+    if "tool_manifest.yaml" in present:
         if _safe_delete(manifest):
             count += 1
             _banner("Tool manifest removed (will regenerate)")
 
-    # __pycache__ and .pytest_cache directories (stale compiled bytecode)
+    return count
+
+
+def clear_python_caches() -> int:
+    """Remove __pycache__ and .pytest_cache directories under ROOT."""
     cache_dir_count = 0
-    for pattern in ("__pycache__", ".pytest_cache"):
-        for d in ROOT.rglob(pattern):
-            if d.is_dir():
-                shutil.rmtree(d, ignore_errors=True)
-                cache_dir_count += 1
+    for path in find_cache_dirs(_CACHE_DIR_NAMES):
+        shutil.rmtree(path, ignore_errors=True)
+        cache_dir_count += 1
     if cache_dir_count:
         _banner(f"Python cache directories removed ({cache_dir_count})")
-    count += cache_dir_count
+    return cache_dir_count
 
-    return count
+
+# Header settings a DDL replay doesn't carry; copied to the rebuilt file
+_SQLITE_HEADER_PRAGMAS = ("page_size", "auto_vacuum", "user_version", "application_id")
+
+
+def _rebuild_sqlite(db_path: Path) -> int:
+    """Replace *db_path* with an empty DB holding the same schema.
+
+    Returns the number of tables recreated.  Raises on anything the
+    replay can't reproduce, or when another connection has the file
+    open; the original file is left untouched then.
+    """
+    conn = sqlite3.connect(str(db_path), timeout=0, isolation_level=None)
+    tmp_path = db_path.with_name(db_path.name + ".reset-tmp")
+    try:
+        # A running Archi would keep writing to the replaced inode and the
+        # reset would be silently lost, so the file must be provably idle.
+        # Only WAL can prove it: idle WAL connections still hold a shared
+        # lock, which an exclusive-mode lock collides with ("database is
+        # locked").  A rollback-journal file gives no such signal.
+        if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+            raise ValueError(f"{db_path.name} is not in WAL mode")
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        conn.execute("BEGIN EXCLUSIVE")  # held until close, past os.replace
+        schema = [(kind, sql) for kind, name, sql in conn.execute(
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE sql IS NOT NULL ORDER BY rowid")
+            if not name.startswith("sqlite_")]
+        header = {name: int(conn.execute(f"PRAGMA {name}").fetchone()[0])
+                  for name in _SQLITE_HEADER_PRAGMAS}
+        # Virtual tables (FTS etc.) keep state in shadow tables that a DDL
+        # replay doesn't reconstruct
+        if any(sql.lstrip()[:20].upper().startswith("CREATE VIRTUAL") for _, sql in schema):
+            raise ValueError(f"{db_path.name} has virtual tables")
+
+        tmp_path.unlink(missing_ok=True)
+        new = sqlite3.connect(str(tmp_path))
+        try:
+            # page_size and auto_vacuum only take effect before the first table
+            new.executescript("".join(f"PRAGMA {name} = {value};\n"
+                                      for name, value in header.items()))
+            new.execute("PRAGMA journal_mode=MEMORY")
+            new.executescript("".join(f"{sql};\n" for _, sql in schema))
+            new.commit()
+            new.execute("PRAGMA journal_mode=WAL")  # persistent, like the original
+        finally:
+            new.close()
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(db_path).st_mode))
+        os.replace(tmp_path, db_path)
+    except BaseException:
+        conn.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Closing checkpoints the old WAL into the orphaned inode; anything
+    # left next to the new file would be replayed into it, so drop it
+    conn.close()
+    for suffix in ("-wal", "-shm", "-journal"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    return sum(1 for kind, _ in schema if kind == "table")
+
+
+def _fadvise(path: Path, advice: int) -> None:
+    """Pass a posix_fadvise() hint for the whole of *path* (POSIX only)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
 
 
 def _clear_sqlite(db_path: Path) -> None:
-    """Drop all rows from user-data tables in a SQLite DB, keep schema."""
+    """Drop all rows from user-data tables in a SQLite DB, keep schema.
+
+    An idle WAL database is rebuilt empty from its schema; otherwise (file
+    in use, not WAL, virtual tables, ...) rows are deleted in place.
+    """
+    try:
+        tables = _rebuild_sqlite(db_path)
+        _banner(f"Database {db_path.name} cleared ({tables} tables)")
+        return
+    except Exception:
+        pass
+    fadvise = hasattr(os, "posix_fadvise")
+    if fadvise:
+        _fadvise(db_path, os.POSIX_FADV_WILLNEED)
     try:
         conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = [row[0] for row in cursor.fetchall()
-                  if not row[0].startswith("sqlite_")]
-        for table in tables:
-            cursor.execute(f"DELETE FROM [{table}]")
-        conn.commit()
-        conn.execute("VACUUM")
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'")
+            if not row[0].startswith("sqlite_")]
+        # Reclaim freed pages according to the auto_vacuum mode
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        reclaim = {1: "", 2: "PRAGMA incremental_vacuum;\n"}.get(auto_vacuum, "VACUUM;\n")
+        deletes = "".join('DELETE FROM "' + t.replace('"', '""') + '";\n'
+                          for t in tables)
+        conn.executescript(f"BEGIN;\n{deletes}COMMIT;\n{reclaim}")
         conn.close()
+        if fadvise:
+            _fadvise(db_path, os.POSIX_FADV_DONTNEED)
         _banner(f"Database {db_path.name} cleared ({len(tables)} tables)")
     except Exception as e:
-        print(f"  ⚠  Could not clear {db_path.name}: {e}")
+        _say(f"  ⚠  Could not clear {db_path.name}: {e}")
 
 
 def clear_workspace_generated() -> int:
@@ -343,8 +583,7 @@ def clear_workspace_generated() -> int:
     for dirname in clear_dirs:
         dirpath = WORKSPACE_DIR / dirname
         if dirpath.exists():
-            file_count = sum(1 for _ in dirpath.rglob("*") if _.is_file())
-            _safe_rmtree(dirpath)
+            file_count = _safe_rmtree(dirpath)
             dirpath.mkdir(parents=True, exist_ok=True)
             count += file_count
             if file_count:
@@ -352,9 +591,9 @@ def clear_workspace_generated() -> int:
 
     # Remove loose generated files at workspace root
     loose_count = 0
-    for fpath in WORKSPACE_DIR.iterdir():
-        if fpath.is_file():
-            if _safe_delete(fpath):
+    with os.scandir(WORKSPACE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and _safe_delete(entry.path):
                 loose_count += 1
     if loose_count:
         _banner(f"Loose workspace files removed ({loose_count})")
@@ -367,27 +606,30 @@ def clear_workspace_generated() -> int:
 
 
 def print_summary(total: int) -> None:
-    print()
-    print(f"  {'─' * 50}")
-    print(f"  Reset complete. {total} items cleared.")
+    lines = [
+        "",
+        f"  {'─' * 50}",
+        f"  Reset complete. {total} items cleared.",
+    ]
     if _skipped:
-        print()
-        print(f"  ⚠  {len(_skipped)} file(s) could not be cleared (locked?):")
-        for s in _skipped[:10]:
-            print(f"      {s}")
+        lines += ["", f"  ⚠  {len(_skipped)} file(s) could not be cleared (locked?):"]
+        lines += [f"      {s}" for s in _skipped[:10]]
         if len(_skipped) > 10:
-            print(f"      ... and {len(_skipped) - 10} more")
-        print("      Tip: stop Archi first, then re-run this script.")
-    print()
-    print("  Preserved:")
-    print("    • Source code (src/, tests/, scripts/)")
-    print("    • Configuration (config/, .env)")
-    print("    • Prime directive & identity")
-    print("    • User project files (workspace/projects/)")
-    print("    • Monthly cost totals (budget enforcement)")
-    print()
-    print("  Archi is ready for a fresh start.")
-    print()
+            lines.append(f"      ... and {len(_skipped) - 10} more")
+        lines.append("      Tip: stop Archi first, then re-run this script.")
+    lines += [
+        "",
+        "  Preserved:",
+        "    • Source code (src/, tests/, scripts/)",
+        "    • Configuration (config/, .env)",
+        "    • Prime directive & identity",
+        "    • User project files (workspace/projects/)",
+        "    • Monthly cost totals (budget enforcement)",
+        "",
+        "  Archi is ready for a fresh start.",
+        "",
+    ]
+    print("\n".join(lines))
 
 
 def main() -> None:
@@ -472,11 +714,31 @@ def main() -> None:
     print("  Resetting...")
     print()
 
+    # logs/, data/ and workspace/ are disjoint, so they are cleared in
+    # parallel; output is printed afterwards in a fixed order.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(_run_buffered, clear_logs),
+            pool.submit(_run_buffered, clear_data_runtime,
+                        clear_project_context=clear_project_ctx,
+                        keep_user_model=keep_user_model),
+            pool.submit(_run_buffered, clear_workspace_generated),
+        ]
+    # Report every section before surfacing a failure, so what was already
+    # deleted is never left unprinted
     total = 0
-    total += clear_logs()
-    total += clear_data_runtime(clear_project_context=clear_project_ctx,
-                                keep_user_model=keep_user_model)
-    total += clear_workspace_generated()
+    errors = []
+    for future in futures:
+        count, lines, error = future.result()
+        total += count
+        if lines:
+            print("\n".join(lines))
+        if error is not None:
+            errors.append(error)
+    if errors:
+        raise errors[0]
+
+    total += clear_python_caches()
 
     # Clear profile-setup-declined marker so start.py offers it again
     declined_marker = DATA_DIR / ".profile_setup_declined"
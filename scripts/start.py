@@ -10,20 +10,16 @@ Usage:
 """
 
 import os
-import subprocess
 import sys
-import time
 from pathlib import Path
 
 # Shared script utilities
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from _common import ROOT, PYTHON, header, load_env
+from _common import ROOT, PYTHON, enter_project, header, load_env
 
 import json
 
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-os.chdir(str(ROOT))
+enter_project()
 
 # Tag this process (and all children) so stop.py can identify Archi reliably
 os.environ["ARCHI_RUNNING_INSTANCE"] = "1"
@@ -154,6 +150,10 @@ def start_discord() -> None:
 
 def start_watchdog() -> None:
     """Run the service with auto-restart on crash."""
+    # Only the watchdog spawns or sleeps; keep these off the service/discord path
+    import subprocess
+    import time
+
     if not _acquire_lock():
         print("  [ERROR] Archi is already running (PID lock exists).")
         print("  Use 'scripts/stop.py' first, or delete data/archi.pid if stale.")
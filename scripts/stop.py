@@ -11,6 +11,7 @@ Usage:
 """
 
 import os
+import re
 import subprocess
 import sys
 import time
@@ -20,6 +21,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from _common import ROOT, PYTHON, header
 
 LOCK_FILE = ROOT / "data" / "archi.pid"
+START_SCRIPT = ROOT / "scripts" / "start.py"
 
 # Specific identifiers — match command lines that are unambiguously Archi.
 ARCHI_IDENTIFIERS = [
@@ -27,6 +29,11 @@ ARCHI_IDENTIFIERS = [
     "agent_loop", "scripts/start.py", "scripts\\start.py",
     "src/service/archi_service", "src\\service\\archi_service",
 ]
+# Matches any of the identifiers
+_ARCHI_RE = re.compile("|".join(map(re.escape, ARCHI_IDENTIFIERS)))
+
+# Process names psutil reports for interpreters (python3.11, pythonw.exe, Python)
+_PYTHON_NAME_PREFIXES = ("python", "Python", "PYTHON")
 
 # For strict entry-point matching (fallback when env var check fails)
 ARCHI_ROOT_STR = str(ROOT).lower()
@@ -42,23 +49,22 @@ def _find_archi_processes_psutil():
     found = []
     current_pid = os.getpid()
 
-    for proc in psutil.process_iter(["pid", "name", "cmdline", "exe"]):
+    for proc in psutil.process_iter(["pid", "name", "cmdline"]):
         try:
             if proc.pid == current_pid:
                 continue
             info = proc.info
-            name = (info.get("name") or "").lower()
-            if "python" not in name:
+            name = info.get("name") or ""
+            if not name.startswith(_PYTHON_NAME_PREFIXES):
                 continue
 
             cmdline_parts = info.get("cmdline") or []
             cmdline = " ".join(cmdline_parts)
 
             # Check 1: Command line contains an Archi identifier
-            for ident in ARCHI_IDENTIFIERS:
-                if ident in cmdline:
-                    found.append((proc, f"cmdline match: {ident}"))
-                    break
+            match = _ARCHI_RE.search(cmdline)
+            if match:
+                found.append((proc, f"cmdline match: {match.group(0)}"))
             else:
                 # Check 2: ARCHI_RUNNING_INSTANCE env var (inherited by all children)
                 try:
@@ -112,31 +118,28 @@ def _kill_processes_psutil(procs) -> int:
 
 def _kill_archi_processes_windows() -> int:
     """Windows fallback (no psutil): use PowerShell to find and force-kill."""
-    killed = 0
+    targets: list[tuple[int, str]] = []
     try:
-        # Get all python processes with their command lines
-        ps_cmd = (
-            'powershell -Command "Get-Process python* -ErrorAction SilentlyContinue '
-            '| ForEach-Object { $id=$_.Id; $cmd=(Get-CimInstance Win32_Process '
-            '-Filter \\\"ProcessId=$id\\\" -ErrorAction SilentlyContinue).CommandLine; '
-            'if($cmd){Write-Output \\\"$id|$cmd\\\"} }"'
+        # All python processes with their command lines
+        ps_script = (
+            "Get-CimInstance Win32_Process -Filter \"Name LIKE 'python%'\" "
+            "-ErrorAction SilentlyContinue | ForEach-Object { "
+            "if ($_.CommandLine) { \"$($_.ProcessId)|$($_.CommandLine)\" } }"
+        )
+        result = subprocess.run(
+            ["powershell", "-NoProfile", "-NonInteractive", "-Command", ps_script],
+            capture_output=True, text=True,
         )
-        result = subprocess.run(ps_cmd, shell=True, capture_output=True, text=True)
         for line in result.stdout.strip().split("\n"):
             line = line.strip()
             if not line or "|" not in line:
                 continue
             pid_str, cmdline = line.split("|", 1)
 
-            is_archi = False
-            reason = ""
-
             # Check identifiers
-            for ident in ARCHI_IDENTIFIERS:
-                if ident in cmdline:
-                    is_archi = True
-                    reason = ident
-                    break
+            match = _ARCHI_RE.search(cmdline)
+            is_archi = match is not None
+            reason = match.group(0) if match else ""
 
             # Strict entry-point: the executed .py script is inside Archi
             if not is_archi:
@@ -151,20 +154,23 @@ def _kill_archi_processes_windows() -> int:
             if is_archi:
                 try:
                     pid = int(pid_str.strip())
-                    if pid != os.getpid():
-                        # Force kill — /F means no asking nicely
-                        subprocess.run(
-                            f"taskkill /PID {pid} /F /T",
-                            shell=True, capture_output=True,
-                        )
-                        print(f"  KILLED PID {pid} ({reason})")
-                        killed += 1
-                except (ValueError, OSError):
-                    pass
+                except ValueError:
+                    continue
+                if pid != os.getpid():
+                    targets.append((pid, reason))
+
+        if targets:
+            # Force kill — /F means no asking nicely
+            pid_args = [a for pid, _ in targets for a in ("/PID", str(pid))]
+            subprocess.run(
+                ["taskkill", "/F", "/T", *pid_args], capture_output=True,
+            )
+            for pid, reason in targets:
+                print(f"  KILLED PID {pid} ({reason})")
 
     except Exception as e:
         print(f"  PowerShell fallback error: {e}")
-    return killed
+    return len(targets)
 
 
 def _clear_lock() -> None:
@@ -221,16 +227,15 @@ def restart() -> None:
     print("\n  Starting Archi...\n")
     time.sleep(2)
 
-    start_script = ROOT / "scripts" / "start.py"
     if sys.platform == "win32":
         subprocess.Popen(
-            f'start "Archi" "{PYTHON}" "{start_script}"',
+            f'start "Archi" "{PYTHON}" "{START_SCRIPT}"',
             shell=True, cwd=str(ROOT),
         )
         print("  Archi started in a new window.")
     else:
         subprocess.Popen(
-            [PYTHON, str(start_script)],
+            [PYTHON, str(START_SCRIPT)],
             cwd=str(ROOT),
             start_new_session=True,
         )
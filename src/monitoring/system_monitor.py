@@ -26,7 +26,7 @@ def _metrics_db_path() -> str:
     return os.path.join(data_dir, "metrics.db")
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Current system health snapshot."""
 
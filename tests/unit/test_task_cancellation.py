@@ -46,15 +46,16 @@ class TestCancelSignal:
     def test_thread_safety(self):
         """Signal from one thread, check from another."""
         results = [None]
+        signalled = threading.Event()
 
         def checker():
-            import time
-            time.sleep(0.05)
+            signalled.wait(timeout=2)
             results[0] = check_and_clear_cancellation()
 
         t = threading.Thread(target=checker)
         t.start()
         signal_task_cancellation("threaded cancel")
+        signalled.set()
         t.join(timeout=2)
 
         assert results[0] == "threaded cancel"